@@ -17,6 +17,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a Zehnder Multicontroller config entry.
 
     Creates the API object, data coordinator and forwards platform setups.
+    When a snapshot from a previous run exists, platforms are set up from it
+    without waiting for the cloud.
     """
     _LOGGER.info(
         "Setting up Zehnder Multicontroller integration for entry %s",
@@ -35,19 +37,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     from .coordinator import RainmakerCoordinator
 
     api = RainmakerAPI(hass, host, username, password)
-    try:
-        _LOGGER.debug("Attempting to connect to Rainmaker API...")
-        await api.async_connect()
-        _LOGGER.info("Successfully connected to Rainmaker API")
-    except Exception as err:
-        _LOGGER.error("Failed to connect to Rainmaker: %s", err)
-        raise ConfigEntryNotReady from err
-
     coordinator = RainmakerCoordinator(hass, api, entry)
-    # Fetch initial data so platforms have data when they are first added
-    _LOGGER.debug("Fetching initial data from coordinator...")
-    await coordinator.async_config_entry_first_refresh()
-    _LOGGER.debug("Initial data fetched: %d nodes found", len(coordinator.data))
+    # Writes speed up polling so their effect is confirmed quickly
+    entry.async_on_unload(api.async_add_write_listener(coordinator.async_note_write))
+
+    restored = await coordinator.async_restore_snapshot()
+    if restored:
+        # Entities are created from the last known snapshot right away; login
+        # and refresh run in the background once platforms are set up so a
+        # slow cloud does not block Home Assistant startup
+        _LOGGER.info(
+            "Restored %d nodes from the last snapshot, refreshing in background",
+            len(coordinator.data),
+        )
+    else:
+        try:
+            _LOGGER.debug("Attempting to connect to Rainmaker API...")
+            await api.async_connect()
+            _LOGGER.info("Successfully connected to Rainmaker API")
+        except Exception as err:
+            _LOGGER.error("Failed to connect to Rainmaker: %s", err)
+            # Return the pooled HTTP session; setup is retried with a new api
+            await api.async_shutdown()
+            raise ConfigEntryNotReady from err
+
+        # Fetch initial data so platforms have data when they are first added
+        _LOGGER.debug("Fetching initial data from coordinator...")
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await api.async_shutdown()
+            raise
+        _LOGGER.debug("Initial data fetched: %d nodes found", len(coordinator.data))
 
     # Store runtime-only references
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
@@ -59,6 +80,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     _LOGGER.info("Platform setup completed for entry %s", entry.entry_id)
 
+    if restored:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} initial refresh {entry.entry_id}",
+        )
+
     return True
 
 
@@ -69,5 +97,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Remove runtime references if they exist
         domain_data = hass.data.get(DOMAIN)
         if domain_data and entry.entry_id in domain_data:
-            domain_data.pop(entry.entry_id)
+            entry_data = domain_data.pop(entry.entry_id)
+            # Drop pending debounced writes before the api goes away
+            await entry_data["coordinator"].async_shutdown()
+            # Release the HTTP session shared with other entries of the host
+            await entry_data["api"].async_shutdown()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot of a deleted config entry."""
+    from homeassistant.helpers.storage import Store
+
+    from .const import STORAGE_VERSION
+    from .coordinator import snapshot_storage_key
+
+    await Store(hass, STORAGE_VERSION, snapshot_storage_key(entry)).async_remove()
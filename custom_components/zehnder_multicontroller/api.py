@@ -1,15 +1,48 @@
 """API adapter for Rainmaker cloud API."""
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import Awaitable
+from collections.abc import Callable
+import inspect
 import logging
+import random
+import time
 from typing import Any
 from typing import cast
+from typing import TypeVar
 
 from aiohttp import ClientError
+from aiohttp import ClientResponseError
+from aiohttp import ClientSession
+from aiohttp import DummyCookieJar
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from rainmaker_http.client import RainmakerClient
+from rainmaker_http.exceptions import (
+    RainmakerConnectionError as RainmakerHttpConnectionError,
+)
+from yarl import URL
+
+from .const import DATA_SESSION_POOL
+from .const import DEFAULT_BREAKER_FAILURE_THRESHOLD
+from .const import DEFAULT_BREAKER_RESET_TIMEOUT
+from .const import DEFAULT_DEADLINES
+from .const import DEFAULT_RETRY_ATTEMPTS
+from .const import DEFAULT_RETRY_BASE_DELAY
+from .const import DEFAULT_RETRY_BUDGET
+from .const import DEFAULT_RETRY_BUDGET_PERIOD
+from .const import DEFAULT_RETRY_JITTER
+from .const import DEFAULT_RETRY_MAX_DELAY
+from .const import DEFAULT_TIMEOUTS
+from .const import DEFAULT_TOKEN_LIFETIME
+from .const import DEFAULT_WRITE_WINDOW
+from .const import TOKEN_REFRESH_MARGIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class RainmakerError(Exception):
     """Base exception for Rainmaker adapter."""
@@ -28,31 +61,354 @@ class RainmakerConnectionError(RainmakerError, RuntimeError):
     """
 
 
+class RainmakerNodeOfflineError(RainmakerError):
+    """Raised when writing to a node the cloud reports as disconnected."""
+
+
+class RainmakerTimeoutError(RainmakerConnectionError):
+    """Raised when a call does not finish within its deadline."""
+
+
+class RainmakerCircuitOpenError(RainmakerConnectionError):
+    """Raised when a call is short-circuited by the open circuit breaker."""
+
+
+def _is_auth_failure(err: BaseException) -> bool:
+    """Return True if `err` was caused by the cloud refusing the token."""
+    cause: BaseException | None = err
+    while cause is not None:
+        if isinstance(cause, ClientResponseError) and cause.status in (401, 403):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+class RainmakerRetryPolicy:
+    """Exponential backoff with jitter and a shared retry budget.
+
+    A call is attempted at most `attempts` times. Retries across all calls
+    are limited to `budget` per `budget_period` seconds so that an outage
+    does not turn into a retry storm.
+    """
+
+    def __init__(
+        self,
+        attempts: int = DEFAULT_RETRY_ATTEMPTS,
+        base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+        max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+        jitter: float = DEFAULT_RETRY_JITTER,
+        budget: int = DEFAULT_RETRY_BUDGET,
+        budget_period: float = DEFAULT_RETRY_BUDGET_PERIOD,
+    ) -> None:
+        """Initialize the policy."""
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.budget = budget
+        self.budget_period = budget_period
+        self.retries = 0
+        self.budget_exhausted = 0
+        self._retry_times: deque[float] = deque()
+
+    def delay(self, attempt: int) -> float:
+        """Return the backoff delay in seconds after failed `attempt`."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def acquire_retry(self) -> bool:
+        """Take a retry from the budget, returning False when it is used up."""
+        now = time.monotonic()
+        while self._retry_times and now - self._retry_times[0] >= self.budget_period:
+            self._retry_times.popleft()
+        if len(self._retry_times) >= self.budget:
+            self.budget_exhausted += 1
+            return False
+        self._retry_times.append(now)
+        self.retries += 1
+        return True
+
+
+class RainmakerCircuitBreaker:
+    """Stop calling the cloud after repeated failures.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    calls fail immediately. Once `reset_timeout` seconds have passed a
+    single half-open probe call is let through; its success closes the
+    breaker again, its failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.total_successes = 0
+        self.short_circuited = 0
+        self.times_opened = 0
+        self.total_rejections = 0
+        self._opened_at: float | None = None
+        self._probe_started_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return the current breaker state."""
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def before_call(self, operation: str) -> None:
+        """Raise `RainmakerCircuitOpenError` when `operation` may not run."""
+        state = self.state
+        if state == self.CLOSED:
+            return
+        now = time.monotonic()
+        if state == self.HALF_OPEN and (
+            self._probe_started_at is None
+            or now - self._probe_started_at >= self.reset_timeout
+        ):
+            _LOGGER.debug("Circuit half-open; probing with %s", operation)
+            self._probe_started_at = now
+            return
+        self.short_circuited += 1
+        raise RainmakerCircuitOpenError(
+            f"Rainmaker circuit breaker is open; skipping {operation}"
+        )
+
+    def record_success(self) -> None:
+        """Record a successful call and close the breaker."""
+        if self._opened_at is not None:
+            _LOGGER.info("Rainmaker cloud reachable again; closing circuit breaker")
+        self.total_successes += 1
+        self.consecutive_failures = 0
+        self._opened_at = None
+        self._probe_started_at = None
+
+    def record_rejection(self) -> None:
+        """Record a call the cloud answered with a rejection.
+
+        A rejected login says nothing about whether the cloud is reachable
+        for other calls, so it counts neither as a success nor a failure; it
+        only frees the half-open probe.
+        """
+        self.total_rejections += 1
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker past the threshold."""
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        self._probe_started_at = None
+        if self._opened_at is not None or (
+            self.consecutive_failures >= self.failure_threshold
+        ):
+            if self._opened_at is None:
+                self.times_opened += 1
+                _LOGGER.warning(
+                    "Opening circuit breaker after %d consecutive failures",
+                    self.consecutive_failures,
+                )
+            self._opened_at = time.monotonic()
+
+
+class RainmakerSessionPool:
+    """HTTP sessions shared by all adapters talking to the same host.
+
+    Sessions are reference counted: the first adapter of a host creates the
+    session and the last one to release it closes it, so keep-alive
+    connections are reused across config entries and the config flow.
+    """
+
+    def __init__(self, hass: Any) -> None:
+        """Initialize an empty pool."""
+        self._hass = hass
+        self._sessions: dict[str, tuple[ClientSession, int]] = {}
+
+    @classmethod
+    def get(cls, hass: Any) -> RainmakerSessionPool:
+        """Return the pool stored in `hass.data`, creating it on first use."""
+        pool = hass.data.get(DATA_SESSION_POOL)
+        if pool is None:
+            pool = hass.data[DATA_SESSION_POOL] = cls(hass)
+        return cast(RainmakerSessionPool, pool)
+
+    def acquire(self, host: str) -> ClientSession:
+        """Return the session of `host` and take a reference to it."""
+        session, refs = self._sessions.get(host, (None, 0))
+        if session is None or session.closed:
+            _LOGGER.debug("Creating shared HTTP session for %s", host)
+            # Tokens are sent as headers; no cookies are shared between accounts
+            session = async_create_clientsession(
+                self._hass, cookie_jar=DummyCookieJar()
+            )
+            refs = 0
+        self._sessions[host] = (session, refs + 1)
+        return session
+
+    async def async_release(self, host: str) -> None:
+        """Drop a reference to the session of `host`, closing it on the last."""
+        if host not in self._sessions:
+            return
+        session, refs = self._sessions[host]
+        if refs > 1:
+            self._sessions[host] = (session, refs - 1)
+            return
+        del self._sessions[host]
+        _LOGGER.debug("Closing shared HTTP session for %s", host)
+        await session.close()
+
+
+class RainmakerWriteQueue:
+    """Coalesce parameter writes into batched set_params requests.
+
+    Writes queued within ``window`` seconds of the first pending write are
+    merged per node and handed to ``flush`` as one batch. ``flush`` returns
+    the per-node failures so that each caller only sees the outcome of the
+    node it wrote to.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[
+            [dict[str, dict[str, Any]]], Awaitable[dict[str, BaseException]]
+        ],
+        window: float = DEFAULT_WRITE_WINDOW,
+    ) -> None:
+        """Initialize the queue with a batch `flush` callback and `window`."""
+        self._flush = flush
+        self.window = window
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._waiters: dict[str, list[asyncio.Future[None]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        """Return the number of nodes with writes waiting to be flushed."""
+        return len(self._pending)
+
+    async def async_write(self, node_id: str, params: dict[str, Any]) -> None:
+        """Queue `params` for `node_id` and wait for the batch result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        # Later writes to the same param within the window win
+        self._pending.setdefault(node_id, {}).update(params)
+        self._waiters.setdefault(node_id, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._async_flush_later())
+        await future
+
+    async def _async_flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        pending, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, {}
+        self._flush_task = None
+
+        try:
+            failures = await self._flush(pending)
+        except Exception as err:  # pragma: no cover - flush handles its errors
+            failures = {node_id: err for node_id in pending}
+
+        for node_id, futures in waiters.items():
+            err = failures.get(node_id)
+            for future in futures:
+                if future.done():
+                    continue
+                if err is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(err)
+
+
 class RainmakerAPI:
     """HTTP adapter for Rainmaker cloud API using `rainmaker-http`.
 
     This adapter implements the minimal operations used by the
     integration: login, nodes listing, params/config retrieval and batch set.
+
+    Without `hass` every client owns its own HTTP session; with it the
+    session is borrowed from a pool shared by all adapters of the host and
+    returned by `async_shutdown`.
+
+    Requests rainmaker-http does not wrap, such as the undecoded node list,
+    are made with the pooled session and a token of the adapter's own, so
+    they need `hass`.
+
+    The access token expiry is tracked so the session is renewed on the
+    existing client shortly before it runs out. The client is only torn
+    down when renewing the session is rejected; it is rebuilt by the next
+    call, so a retry cycle never logs in more than once.
+
+    Cloud calls run under a retry policy with exponential backoff and a
+    circuit breaker; their state is available through `stats`.
     """
 
     def __init__(
-        self, hass: Any | None, host: Any, username: Any, password: Any
+        self,
+        hass: Any | None,
+        host: Any,
+        username: Any,
+        password: Any,
+        write_window: float = DEFAULT_WRITE_WINDOW,
+        retry_policy: RainmakerRetryPolicy | None = None,
+        circuit_breaker: RainmakerCircuitBreaker | None = None,
+        timeouts: dict[str, float] | None = None,
+        deadlines: dict[str, float] | None = None,
     ) -> None:
-        """Initialize adapter with Home Assistant `hass`, host and creds."""
+        """Initialize adapter with Home Assistant `hass`, host and creds.
+
+        `write_window` is the time in seconds during which writes are
+        collected before being sent as a single batch. `retry_policy` and
+        `circuit_breaker` govern login, fetch and write calls. `timeouts`
+        overrides the per-attempt deadline of the "login", "list" and
+        "write" operations and `deadlines` the one of a whole call including
+        its retries.
+        """
         self._hass = hass
         self.host = str(host).rstrip("/") + "/" if host is not None else ""
         self.username = str(username) if username is not None else ""
         self.password = str(password) if password is not None else ""
         self._client: RainmakerClient | None = None
+        # HTTP session borrowed from the pool of `hass`, if any
+        self._session: ClientSession | None = None
         self._connected = False
+        self.token_lifetime: float = DEFAULT_TOKEN_LIFETIME
+        self._token_expires_at: float | None = None
+        # Access token for requests made without the client, fetched lazily
+        # and dropped whenever the session of the client is renewed
+        self._token: str | None = None
+        # In-flight session renewal or reconnect shared by concurrent callers
+        self._session_task: asyncio.Task[None] | None = None
         # currently, we only support the multicontrol service
         self._service_name: str = "multicontrol"
+        self._write_queue = RainmakerWriteQueue(self._async_flush_writes, write_window)
+        self.retry_policy = retry_policy or RainmakerRetryPolicy()
+        self.circuit_breaker = circuit_breaker or RainmakerCircuitBreaker()
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+        self._write_listeners: list[Callable[[str, dict[str, Any]], None]] = []
 
     async def async_close(self) -> None:
         """Close any resources held by the adapter."""
-        if self._client is not None:
+        # rainmaker-http clients only have `close()`, which is a coroutine
+        # function in current releases; a client built on a pooled session
+        # leaves that session open
+        close = getattr(self._client, "close", None)
+        if close is not None:
             try:
-                await self._client.async_close()
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
             except (
                 ClientError,
                 RuntimeError,
@@ -61,97 +417,434 @@ class RainmakerAPI:
 
         self._client = None
         self._connected = False
+        self._token_expires_at = None
+        self._token = None
+
+    async def async_shutdown(self) -> None:
+        """Close the adapter and return its HTTP session to the pool."""
+        await self.async_close()
+        if self._session is not None:
+            self._session = None
+            await RainmakerSessionPool.get(self._hass).async_release(self.host)
 
     async def async_connect(self) -> None:
-        """Authenticate against Rainmaker using the PyPI client."""
+        """Authenticate against Rainmaker using the PyPI client.
+
+        This makes a single attempt so callers such as the config flow get a
+        prompt answer; reconnects retry according to the retry policy.
+        """
+        await self._async_call("login", self._async_login, attempts=1)
+
+    async def _async_login(self) -> None:
+        _LOGGER.debug("Initializing RainmakerClient with host: %s", self.host)
+        if self._session is None and self._hass is not None:
+            self._session = RainmakerSessionPool.get(self._hass).acquire(self.host)
+        client = RainmakerClient(self.host, session=self._session)
+        self._client = client
+        await self._async_client_login(client)
+
+        self._connected = True
+        self._token_expires_at = time.monotonic() + self.token_lifetime
+        _LOGGER.info("Rainmaker HTTP client login successful (host=%s)", self.host)
+
+    async def _async_client_login(self, client: RainmakerClient) -> None:
+        """Log `client` in, telling transport failures from rejections.
+
+        Transport failures raise `RainmakerConnectionError` so they are
+        retried; anything else means the cloud refused the credentials.
+        rainmaker-http reports any non-200 login, a wrong password included,
+        as its connection error, so only those caused by the transport count
+        as network errors.
+        """
+        _LOGGER.debug("Attempting login with username: %s", self.username)
         try:
-            _LOGGER.debug("Initializing RainmakerClient with host: %s", self.host)
-            client = RainmakerClient(self.host)
-            self._client = client
-            _LOGGER.debug("Attempting login with username: %s", self.username)
             await client.async_login(self.username, self.password)
-        except ClientError as err:
-            _LOGGER.error("Network error during rainmaker login: %s", err)
-            raise RainmakerConnectionError("Network error") from err
         except Exception as err:
+            transport = (ClientError, OSError)
+            if isinstance(err, transport) or (
+                isinstance(err, RainmakerHttpConnectionError)
+                and isinstance(err.__cause__, transport)
+            ):
+                _LOGGER.error("Network error during rainmaker login: %s", err)
+                raise RainmakerConnectionError("Network error") from err
             _LOGGER.error(
                 "Authentication/login failed: %s (type: %s)", err, type(err).__name__
             )
             raise RainmakerAuthError("Authentication failed") from err
 
-        self._connected = True
-        _LOGGER.info("Rainmaker HTTP client login successful (host=%s)", self.host)
+    async def _async_call(
+        self,
+        operation: str,
+        call: Callable[[], Awaitable[_T]],
+        on_retry: Callable[[Exception], Awaitable[None]] | None = None,
+        attempts: int | None = None,
+    ) -> _T:
+        """Run `call` under the retry policy and circuit breaker.
+
+        Each attempt is cancelled once the timeout of `operation` passes,
+        which is reported as `RainmakerTimeoutError`. No retry is started
+        that could not finish within the deadline of the whole call, and an
+        attempt running into it is cancelled. Authentication errors
+        are not retried and do not count towards the circuit breaker.
+        `on_retry` runs with the failure before each retry, e.g. to renew
+        the session; the retry goes ahead even when it fails.
+        """
+        policy = self.retry_policy
+        max_attempts = attempts if attempts is not None else policy.attempts
+        loop = asyncio.get_running_loop()
+        timeout = self.timeouts.get(operation)
+        deadline = self.deadlines.get(operation)
+        give_up_at = loop.time() + deadline if deadline is not None else None
+        attempt = 0
+        while True:
+            attempt += 1
+            self.circuit_breaker.before_call(operation)
+            started = loop.time()
+            cancel_at = started + timeout if timeout is not None else None
+            if give_up_at is not None and (cancel_at is None or cancel_at > give_up_at):
+                cancel_at = give_up_at
+            try:
+                try:
+                    async with asyncio.timeout_at(cancel_at):
+                        result = await call()
+                except TimeoutError as err:
+                    raise RainmakerTimeoutError(
+                        f"Rainmaker {operation} timed out after "
+                        f"{loop.time() - started:.1f}s"
+                    ) from err
+            except RainmakerAuthError:
+                self.circuit_breaker.record_rejection()
+                raise
+            except Exception as err:
+                self.circuit_breaker.record_failure()
+                delay = policy.delay(attempt)
+                if (
+                    attempt >= max_attempts
+                    or self.circuit_breaker.state != RainmakerCircuitBreaker.CLOSED
+                    or (give_up_at is not None and loop.time() + delay >= give_up_at)
+                    or not policy.acquire_retry()
+                ):
+                    raise
+                _LOGGER.warning(
+                    "Rainmaker %s failed on attempt %d: %s (type: %s); "
+                    "retrying in %.1fs",
+                    operation,
+                    attempt,
+                    err,
+                    type(err).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                if on_retry is not None:
+                    try:
+                        await on_retry(err)
+                    except RainmakerError as retry_err:
+                        _LOGGER.debug(
+                            "Preparing retry of %s failed: %s", operation, retry_err
+                        )
+                if give_up_at is not None and loop.time() >= give_up_at:
+                    raise err
+            else:
+                self.circuit_breaker.record_success()
+                return result
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return circuit breaker and retry counters."""
+        breaker = self.circuit_breaker
+        return {
+            "circuit_state": breaker.state,
+            "consecutive_failures": breaker.consecutive_failures,
+            "total_failures": breaker.total_failures,
+            "total_successes": breaker.total_successes,
+            "short_circuited": breaker.short_circuited,
+            "times_opened": breaker.times_opened,
+            "rejections": breaker.total_rejections,
+            "retries": self.retry_policy.retries,
+            "retry_budget_exhausted": self.retry_policy.budget_exhausted,
+        }
+
+    @property
+    def token_expires_in(self) -> float | None:
+        """Return the seconds until the access token expires, if known."""
+        if self._token_expires_at is None:
+            return None
+        return self._token_expires_at - time.monotonic()
 
     async def _ensure_connection(self) -> None:
         if self._client is None or not self._connected:
             _LOGGER.debug("Rainmaker client not connected; reconnecting")
             await self._reconnect()
+            return
+
+        expires_in = self.token_expires_in
+        if expires_in is not None and expires_in <= TOKEN_REFRESH_MARGIN:
+            _LOGGER.debug("Access token expires in %.0fs; renewing", expires_in)
+            await self._async_refresh_session()
+
+    async def _async_prepare_retry(self, err: Exception) -> None:
+        """Renew the session before a retry if the failure calls for it.
+
+        Transient failures are retried on the existing session; a login is
+        only made when the client is gone, the token is about to expire or
+        the cloud refused it.
+        """
+        expires_in = self.token_expires_in
+        if (
+            self._client is None
+            or not self._connected
+            or (expires_in is not None and expires_in <= TOKEN_REFRESH_MARGIN)
+            or _is_auth_failure(err)
+        ):
+            await self._async_refresh_session()
+
+    async def _async_refresh_session(self) -> None:
+        """Renew the access token on the existing client.
+
+        This keeps the client and its HTTP session and makes a single login
+        attempt, since it also runs between the retries of other calls. A
+        rejected renewal drops the client so the next call rebuilds it.
+        Concurrent callers share a single renewal.
+        """
+        await self._async_single_flight(self._async_renew_session)
+
+    async def _async_renew_session(self) -> None:
+        client = self._client
+        if client is None:
+            await self._async_reconnect_now(attempts=1)
+            return
+
+        try:
+            await self._async_call(
+                "login", lambda: self._async_client_login(client), attempts=1
+            )
+        except RainmakerAuthError as err:
+            _LOGGER.debug("Session renewal rejected (%s); dropping client", err)
+            await self.async_close()
+            raise
+
+        self._connected = True
+        self._token_expires_at = time.monotonic() + self.token_lifetime
+        self._token = None
 
     async def _reconnect(self) -> None:
+        """Rebuild the client; concurrent callers share a single attempt."""
+        await self._async_single_flight(self._async_reconnect_now)
+
+    async def _async_reconnect_now(self, attempts: int | None = None) -> None:
         self._connected = False
         await self.async_close()
-        await self.async_connect()
+        await self._async_call("login", self._async_login, attempts=attempts)
 
-    async def async_get_nodes(self) -> dict[str, Any]:
-        """Return a list of normalized nodes with params and params_meta."""
-        await self._ensure_connection()
+    async def _async_single_flight(
+        self, operation: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Run a session operation at most once at a time.
+
+        Callers arriving while an operation is in flight wait for it and
+        share its result instead of starting another one. Operations started
+        from within the in-flight one (e.g. a renewal falling back to a
+        reconnect) run inline.
+        """
+        task = self._session_task
+        if task is not None and not task.done():
+            if asyncio.current_task() is task:
+                await operation()
+                return
+            _LOGGER.debug("Waiting for in-flight session operation")
+        else:
+            task = asyncio.get_running_loop().create_task(operation())
+            self._session_task = task
+        # Shield so a cancelled caller does not cancel the shared operation
+        await asyncio.shield(task)
 
-        data: dict[str, Any] | None = None
-        for attempt in (1, 2):
+    async def _async_wait_for_session(self) -> None:
+        """Wait for an in-flight renewal or reconnect to finish."""
+        task = self._session_task
+        if task is not None and not task.done():
             try:
-                assert self._client is not None
-                _LOGGER.debug(
-                    "Fetching nodes from Rainmaker API (attempt %d)...", attempt
-                )
-                data = cast(
-                    dict[str, Any],
-                    await self._client.async_get_nodes(node_details=True),
-                )
-                _LOGGER.debug("Successfully fetched nodes data")
-                break
-            except Exception as err:  # pragma: no cover - network resilience
-                _LOGGER.warning(
-                    "Failed to fetch nodes on attempt %d: %s (type: %s)",
-                    attempt,
-                    err,
-                    type(err).__name__,
-                )
-                if attempt == 1:
-                    await self._reconnect()
-                    continue
-                _LOGGER.error("Exhausted retries fetching nodes after reconnect")
-                raise RainmakerConnectionError(f"Failed to fetch nodes: {err}") from err
+                await asyncio.shield(task)
+            except Exception:  # pragma: no cover - caller checks the state
+                pass
 
-        if data is None:  # pragma: no cover - defensive safety
-            raise RainmakerConnectionError("Failed to fetch nodes: no data returned")
-        if "node_details" not in data:
-            _LOGGER.error(
-                "API response missing node_details. Keys present: %s",
-                list(data.keys()) if isinstance(data, dict) else type(data),
+    async def async_get_nodes_payload(self, config: bool = True) -> bytes:
+        """Return the undecoded JSON of all nodes with their details.
+
+        Without `config` the cloud leaves out the node configs, which is all
+        a poll of param values and connectivity needs. Decoding is left to
+        the caller so that large accounts can decode off the event loop.
+        """
+        await self._ensure_connection()
+        params = {"node_details": "true"}
+        if not config:
+            params["config"] = "false"
+
+        async def _fetch() -> bytes:
+            _LOGGER.debug("Fetching nodes from Rainmaker API...")
+            return await self._async_get_raw("user/nodes", params)
+
+        try:
+            payload = await self._async_call(
+                "list", _fetch, on_retry=self._async_prepare_retry
             )
-            raise RainmakerError(f"Wrong data format for nodes: {data}")
+        except (RainmakerCircuitOpenError, RainmakerTimeoutError):
+            raise
+        except Exception as err:
+            _LOGGER.error("Exhausted retries fetching nodes: %s", err)
+            raise RainmakerConnectionError(f"Failed to fetch nodes: {err}") from err
+        _LOGGER.debug("Successfully fetched nodes data (%d bytes)", len(payload))
+        return payload
 
-        _LOGGER.debug("Found %d node(s) in response", len(data.get("node_details", [])))
+    async def async_get_node_params(self, node_id: str) -> dict[str, Any]:
+        """Return the current param values of a single node.
+
+        This is the cheap call to use when only the values of one node are
+        needed, e.g. to confirm a write.
+        """
+        await self._ensure_connection()
+
+        async def _fetch() -> Any:
+            if self._client is None:
+                raise RainmakerConnectionError("Not connected")
+            return await self._client.async_get_params(node_id)
+
+        try:
+            data = await self._async_call(
+                "list", _fetch, on_retry=self._async_prepare_retry
+            )
+        except (RainmakerCircuitOpenError, RainmakerTimeoutError):
+            raise
+        except Exception as err:
+            _LOGGER.debug("Failed to fetch params for node %s: %s", node_id, err)
+            raise RainmakerConnectionError(
+                f"Failed to fetch params for node {node_id}: {err}"
+            ) from err
+
+        if not isinstance(data, dict):
+            raise RainmakerError(f"Wrong data format for node params: {data}")
         return data
 
+    async def _async_get_raw(self, path: str, params: dict[str, str]) -> bytes:
+        """GET `path` with the pooled session and return the undecoded body.
+
+        rainmaker-http only wraps some endpoints, always decodes their
+        responses and keeps its token to itself, so these requests carry a
+        token the adapter fetches with a login of its own.
+        """
+        session = self._session
+        if self._client is None or session is None:
+            raise RainmakerConnectionError("Not connected")
+        if self._token is None:
+            self._token = await self._async_fetch_token(session)
+        try:
+            resp = await session.get(
+                str(URL(self.host) / path),
+                headers={"Authorization": self._token},
+                params=params,
+            )
+            resp.raise_for_status()
+            return cast(bytes, await resp.read())
+        except ClientError as err:
+            if _is_auth_failure(err):
+                self._token = None
+            raise RainmakerConnectionError(f"Failed to fetch {path}") from err
+
+    async def _async_fetch_token(self, session: ClientSession) -> str:
+        """Log in with `session` and return the access token."""
+        try:
+            resp = await session.post(
+                str(URL(self.host) / "login2"),
+                json={"user_name": self.username, "password": self.password},
+            )
+            data = await resp.json(content_type=None) if resp.status == 200 else None
+        except (ClientError, ValueError) as err:
+            raise RainmakerConnectionError("Login request failed") from err
+        token = None
+        if isinstance(data, dict) and data.get("status") == "success":
+            token = data.get("accesstoken") or data.get("idtoken")
+        if not token:
+            raise RainmakerAuthError(f"Login rejected (HTTP {resp.status})")
+        return cast(str, token)
+
+    def async_add_write_listener(
+        self, listener: Callable[[str, dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Call `listener(node_id, params)` after every accepted write.
+
+        Returns a callable that removes the listener.
+        """
+        self._write_listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self._write_listeners:
+                self._write_listeners.remove(listener)
+
+        return remove_listener
+
     async def async_set_param(self, node_id: str, param: str, value: Any) -> None:
+        """Set a single param, batched with other writes in the same window."""
+        await self.async_set_params(node_id, {param: value})
+
+    async def async_set_params(self, node_id: str, params: dict[str, Any]) -> None:
+        """Set several params of one node in a single multicontrol payload.
+
+        All params are applied together, so the node is never left with only
+        part of the change applied by this call.
+        """
         if not self._connected:
             raise RainmakerConnectionError("Not connected")
 
-        payload = {self._service_name: {param: value}}
+        await self._write_queue.async_write(node_id, params)
+
+    async def _async_flush_writes(
+        self, writes: dict[str, dict[str, Any]]
+    ) -> dict[str, BaseException]:
+        """Send queued writes as one batch and return per-node failures."""
+        await self._async_wait_for_session()
+        if self._client is None or not self._connected:
+            err = RainmakerConnectionError("Not connected")
+            return {node_id: err for node_id in writes}
+
+        batch = [
+            {"node_id": node_id, "payload": {self._service_name: params}}
+            for node_id, params in writes.items()
+        ]
+        _LOGGER.debug(
+            "Flushing %d queued write(s) for %d node(s)",
+            sum(len(params) for params in writes.values()),
+            len(batch),
+        )
+
+        async def _send() -> Any:
+            await self._async_wait_for_session()
+            if self._client is None:
+                raise RainmakerConnectionError("Not connected")
+            return await self._client.async_set_params(batch)
 
-        batch = [{"node_id": node_id, "payload": payload}]
         try:
-            assert self._client is not None
-            result = await self._client.async_set_params(batch)
+            result = await self._async_call("write", _send)
         except Exception as err:
-            _LOGGER.debug("Failed to set param via rainmaker client: %s", err)
-            raise RainmakerError("Failed to set param") from err
+            _LOGGER.debug("Failed to set params via rainmaker client: %s", err)
+            failure = (
+                RainmakerTimeoutError("Timed out setting param")
+                if isinstance(err, RainmakerTimeoutError)
+                else RainmakerError("Failed to set param")
+            )
+            failure.__cause__ = err
+            return {node_id: failure for node_id in writes}
 
+        failures: dict[str, BaseException] = {}
         if isinstance(result, list):
             for res in result:
-                if res.get("node_id") == node_id and res.get("status") != "success":
-                    raise RainmakerError(f"Failed to set param: {res}")
+                node_id = res.get("node_id")
+                if node_id in writes and res.get("status") != "success":
+                    failures[node_id] = RainmakerError(f"Failed to set param: {res}")
+
+        for node_id, params in writes.items():
+            if node_id not in failures:
+                for listener in list(self._write_listeners):
+                    listener(node_id, params)
+        return failures
 
     @property
     def is_connected(self) -> bool:
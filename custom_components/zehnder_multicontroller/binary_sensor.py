@@ -6,18 +6,21 @@ from functools import cached_property
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
+from .entity import RainmakerNodeEntity
+from .model import EntityDescriptor
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class RainmakerParamBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class RainmakerParamBinarySensor(RainmakerNodeEntity, BinarySensorEntity):
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -26,7 +29,8 @@ class RainmakerParamBinarySensor(CoordinatorEntity, BinarySensorEntity):
         node_name: str,
         param: str,
     ) -> None:
-        super().__init__(coordinator)
+        # Only get notified when this param changes
+        super().__init__(coordinator, context=(node_id, param))
         self._entry_id = entry_id
         self._node_id = node_id
         self._node_name = node_name
@@ -44,8 +48,7 @@ class RainmakerParamBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        params = self.coordinator.data.get(self._node_id, {})
-        value = params.get(self._param, {}).get("value")
+        value = self._param_value(self._param)
         return bool(value) if value is not None else None
 
     @cached_property
@@ -69,21 +72,13 @@ async def async_setup_entry(
 
     coordinator: DataUpdateCoordinator = entry_data["coordinator"]
 
-    entities: list[RainmakerParamBinarySensor] = []
-    for node_id, params in coordinator.data.items():
-        node_name = params.get("Name", {}).get("value", node_id)
-        for param, meta in params.items():
-            # Skip schedules, config, and Name parameters
-            if param == "Name" or param == "config" or "schedule" in param.lower():
-                continue
-            if (
-                meta.get("data_type") == "bool"
-                and "read" in meta.get("properties", [])
-                and "write" not in meta.get("properties", [])
-            ):
-                entity = RainmakerParamBinarySensor(
-                    coordinator, entry.entry_id, node_id, node_name, param
-                )
-                entities.append(entity)
+    @callback
+    def create_entity(desc: EntityDescriptor) -> RainmakerParamBinarySensor:
+        node_name = coordinator.data[desc.node_id].value("Name", desc.node_id)
+        return RainmakerParamBinarySensor(
+            coordinator, entry.entry_id, desc.node_id, node_name, desc.param
+        )
 
-    async_add_entities(entities, True)
+    coordinator.async_add_entity_platform(
+        Platform.BINARY_SENSOR, create_entity, async_add_entities
+    )
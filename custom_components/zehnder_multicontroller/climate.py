@@ -9,21 +9,28 @@ from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate import ClimateEntityFeature
 from homeassistant.components.climate import HVACMode
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .api import RainmakerError
 from .const import DOMAIN
+from .entity import RainmakerNodeEntity
+from .model import EntityDescriptor
+from .model import NodeState
+from .model import ParamState
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_FAN_NAMES = ["Away", "Low", "Medium", "High"]
 
 
-class ZehnderClimate(CoordinatorEntity, ClimateEntity):
+class ZehnderClimate(RainmakerNodeEntity, ClimateEntity):
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -31,7 +38,8 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
         node_id: str,
         node_name: str,
     ) -> None:
-        super().__init__(coordinator)
+        # Get notified about changes of any param of the node
+        super().__init__(coordinator, context=(node_id, None))
         self._entry_id = entry_id
         self._node_id = node_id
         self._node_name = node_name
@@ -43,8 +51,10 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
         except AttributeError:
             self._attr_temperature_unit = "°C"
 
-        # Initialize fan names based on fan_speed bounds
-        self._fan_names = self._initialize_fan_names()
+        # Node the derived attributes below were computed from
+        self._node: NodeState | None = None
+        self._fan_names: list[str] = DEFAULT_FAN_NAMES
+        self._update_derived_attributes(coordinator.data.get(node_id))
 
         _LOGGER.debug(
             "Creating ZehnderClimate for node %s with fan names: %s",
@@ -52,8 +62,28 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
             self._fan_names,
         )
 
+    def _current_node(self) -> NodeState | None:
+        """Return the node, updating derived attributes if it was rebuilt.
+
+        The coordinator only builds a new node object when the node schema
+        changes, so fan names and features computed from the param metadata
+        stay valid as long as the node object does.
+        """
+        node = self.coordinator.data.get(self._node_id)
+        if node is not self._node:
+            self._update_derived_attributes(node)
+        return node
+
+    def _update_derived_attributes(self, node: NodeState | None) -> None:
+        self._node = node
+        self._fan_names = self._initialize_fan_names()
         self._attr_supported_features = self.get_supported_features()
 
+    def _lookup(self, name: str) -> ParamState | None:
+        """Return the param with lower-cased name `name`."""
+        node = self._current_node()
+        return node.lookup(name) if node is not None else None
+
     def _initialize_fan_names(self) -> list[str]:
         """Initialize fan mode names based on fan_speed bounds."""
         node_data = self.coordinator.data.get(self._node_id, {})
@@ -61,7 +91,7 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
         if "fan_speed" not in node_data:
             return DEFAULT_FAN_NAMES
 
-        bounds = node_data["fan_speed"].get("bounds", {})
+        bounds = node_data["fan_speed"].meta.bounds or {}
         min_val = bounds.get("min", 0)
         max_val = bounds.get("max", 3)
 
@@ -93,19 +123,13 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def current_temperature(self) -> float | None:
-        node_data = self.coordinator.data.get(self._node_id, {})
-        for param, meta in node_data.items():
-            if param.lower() == "temp":
-                return meta.get("value")
-        return None
+        state = self._lookup("temp")
+        return state.value if state is not None else None
 
     @property
     def target_temperature(self) -> float | None:
-        node_data = self.coordinator.data.get(self._node_id, {})
-        for param, meta in node_data.items():
-            if param.lower() == "temp_setpoint":
-                return meta.get("value")
-        return None
+        state = self._lookup("temp_setpoint")
+        return state.value if state is not None else None
 
     @cached_property
     def hvac_modes(self) -> list[HVACMode]:
@@ -113,16 +137,11 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def hvac_mode(self) -> HVACMode | None:
-        node_data = self.coordinator.data.get(self._node_id, {})
-        season = None
-        enabled = None
-        for param, meta in node_data.items():
-            if param.lower() == "season":
-                season = meta.get("value")
-            elif param.lower() == "radiant_enabled":
-                enabled = meta.get("value")
-        if not enabled:
+        enabled = self._lookup("radiant_enabled")
+        if enabled is None or not enabled.value:
             return HVACMode.OFF
+        state = self._lookup("season")
+        season = state.value if state is not None else None
         if season == 1:
             return HVACMode.HEAT
         if season == 2:
@@ -133,33 +152,27 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
         features_flag = ClimateEntityFeature(0)
         node_data = self.coordinator.data.get(self._node_id, {})
 
-        has_temp_setpoint = "temp_setpoint" in node_data and "write" in node_data[
-            "temp_setpoint"
-        ].get("properties", [])
+        has_temp_setpoint = (
+            "temp_setpoint" in node_data
+            and "write" in node_data["temp_setpoint"].meta.properties
+        )
         if has_temp_setpoint:
             features_flag |= ClimateEntityFeature.TARGET_TEMPERATURE
 
-        has_fan = "fan_speed" in node_data and "write" in node_data["fan_speed"].get(
-            "properties", []
+        has_fan = (
+            "fan_speed" in node_data
+            and "write" in node_data["fan_speed"].meta.properties
         )
         if has_fan:
             features_flag |= ClimateEntityFeature.FAN_MODE
 
-        _LOGGER.debug(
-            "ZehnderClimate(%s) params keys=%s -> features=%s",
-            self._node_id,
-            list(node_data.keys()),
-            features_flag,
-        )
-
         return features_flag
 
     def _handle_coordinator_update(self) -> None:
         try:
-            # Recompute any derived attributes that depend on coordinator data
-            # so they reflect runtime changes (e.g. fan_speed bounds -> names).
-            self._fan_names = self._initialize_fan_names()
-            self._attr_supported_features = self.get_supported_features()
+            # Recompute derived attributes if the node schema changed (e.g.
+            # fan_speed bounds -> names)
+            self._current_node()
         except Exception:  # pragma: no cover - defensive
             _LOGGER.exception(
                 "Failed to update supported features for %s", self._node_id
@@ -168,14 +181,14 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def fan_modes(self) -> list[str] | None:
+        self._current_node()
         return self._fan_names
 
     @property
     def fan_mode(self) -> str | None:
-        node_data = self.coordinator.data.get(self._node_id, {})
-        if "fan_speed" not in node_data:
-            return None
-        val = node_data["fan_speed"].get("value")
+        node = self._current_node()
+        state = node.params.get("fan_speed") if node is not None else None
+        val = state.value if state is not None else None
         if val is None:
             return None
         level = int(val)
@@ -189,45 +202,45 @@ class ZehnderClimate(CoordinatorEntity, ClimateEntity):
         if temperature is None:
             return
         try:
-            await self.coordinator.api.async_set_param(
+            # Stepping the setpoint produces bursts; only the last one is sent
+            await self.coordinator.async_set_param_debounced(
                 self._node_id, "temp_setpoint", temperature
             )
-            await self.coordinator.async_request_refresh()
-        except Exception:  # pragma: no cover - runtime dependent
-            _LOGGER.exception("Failed to set temperature on %s", self._node_id)
+        except RainmakerError as err:
+            raise HomeAssistantError(
+                f"Failed to set temperature on {self._node_id}: {err}"
+            ) from err
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         try:
             if hvac_mode == HVACMode.OFF.value:
-                await self.coordinator.api.async_set_param(
+                await self.coordinator.async_set_param(
                     self._node_id, "radiant_enabled", False
                 )
             elif hvac_mode == HVACMode.HEAT.value:
-                await self.coordinator.api.async_set_param(self._node_id, "season", 1)
-                await self.coordinator.api.async_set_param(
-                    self._node_id, "radiant_enabled", True
+                await self.coordinator.async_set_params(
+                    self._node_id, {"season": 1, "radiant_enabled": True}
                 )
             elif hvac_mode == HVACMode.COOL.value:
-                await self.coordinator.api.async_set_param(self._node_id, "season", 2)
-                await self.coordinator.api.async_set_param(
-                    self._node_id, "radiant_enabled", True
+                await self.coordinator.async_set_params(
+                    self._node_id, {"season": 2, "radiant_enabled": True}
                 )
-            await self.coordinator.async_request_refresh()
-        except Exception:  # pragma: no cover - runtime dependent
-            _LOGGER.exception("Failed to set hvac mode on %s", self._node_id)
+        except RainmakerError as err:
+            raise HomeAssistantError(
+                f"Failed to set hvac mode on {self._node_id}: {err}"
+            ) from err
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
+        if fan_mode not in self._fan_names:
+            _LOGGER.warning("Unknown fan mode: %s", fan_mode)
+            return
+        level = self._fan_names.index(fan_mode)
         try:
-            if fan_mode not in self._fan_names:
-                _LOGGER.warning("Unknown fan mode: %s", fan_mode)
-                return
-            level = self._fan_names.index(fan_mode)
-            await self.coordinator.api.async_set_param(
-                self._node_id, "fan_speed", level
-            )
-            await self.coordinator.async_request_refresh()
-        except Exception:  # pragma: no cover - runtime dependent
-            _LOGGER.exception("Failed to set fan mode on %s", self._node_id)
+            await self.coordinator.async_set_param(self._node_id, "fan_speed", level)
+        except RainmakerError as err:
+            raise HomeAssistantError(
+                f"Failed to set fan mode on {self._node_id}: {err}"
+            ) from err
 
 
 async def async_setup_entry(
@@ -245,17 +258,12 @@ async def async_setup_entry(
     coordinator = entry_data["coordinator"]
     _LOGGER.debug("Coordinator data contains %d nodes", len(coordinator.data))
 
-    entities: list[ZehnderClimate] = []
     registry = er.async_get(hass)
 
-    for node_id, params in coordinator.data.items():
-        _LOGGER.debug("Checking node %s for climate entity creation", node_id)
-        _LOGGER.debug("Node %s params: %s", node_id, list(params.keys()))
-
-        if "temp" not in params:
-            _LOGGER.debug("Node %s does not have 'temp' parameter, skipping", node_id)
-            continue
-
+    # Only nodes with a 'temp' parameter get a climate entity
+    @callback
+    def create_entity(desc: EntityDescriptor) -> ZehnderClimate | None:
+        node_id = desc.node_id
         unique_id = f"{entry.entry_id}_{node_id}_climate"
 
         if registry.async_get_entity_id("climate", DOMAIN, unique_id) is not None:
@@ -264,14 +272,15 @@ async def async_setup_entry(
                 node_id,
                 unique_id,
             )
-            continue
+            return None
 
-        node_name = params.get("Name", {}).get("value", node_id)
+        node_name = coordinator.data[node_id].value("Name", node_id)
         _LOGGER.info(
             "Creating climate entity for node %s (name: %s)", node_id, node_name
         )
-        entities.append(ZehnderClimate(coordinator, entry.entry_id, node_id, node_name))
+        return ZehnderClimate(coordinator, entry.entry_id, node_id, node_name)
 
-    _LOGGER.info("Adding %d climate entities", len(entities))
-    async_add_entities(entities, True)
+    coordinator.async_add_entity_platform(
+        Platform.CLIMATE, create_entity, async_add_entities
+    )
     _LOGGER.info("Climate platform setup completed")
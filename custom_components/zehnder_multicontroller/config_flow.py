@@ -31,7 +31,10 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     from .api import RainmakerAPI
 
     api = RainmakerAPI(hass, data[CONF_HOST], data[CONF_USERNAME], data[CONF_PASSWORD])
-    await api.async_connect()
+    try:
+        await api.async_connect()
+    finally:
+        await api.async_shutdown()
 
     return {"title": "Zehnder Multicontroller"}
 
@@ -18,5 +18,70 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+# hass.data key of the HTTP sessions shared between entries of the same host
+DATA_SESSION_POOL = f"{DOMAIN}_session_pool"
+
 # Default polling interval in seconds
 DEFAULT_SCAN_INTERVAL = 120
+
+# Consecutive failed polls of a node before its entities become unavailable
+NODE_FAILURES_BEFORE_UNAVAILABLE = 3
+
+# Adaptive polling: floor and ceiling of the polling interval in seconds,
+# number of fast polls after a write and the factor by which the interval
+# grows for every poll that did not change anything
+MIN_SCAN_INTERVAL = 10
+MAX_SCAN_INTERVAL = 600
+FAST_POLLS_AFTER_WRITE = 3
+IDLE_BACKOFF_FACTOR = 1.5
+
+# Interval in seconds after which the node configs (param schemas) are
+# fetched again. Regular polls in between only fetch param values.
+DEFAULT_SCHEMA_REFRESH_INTERVAL = 3600
+
+# Lifetime in seconds of a Rainmaker access token and how long before its
+# expiry the session is renewed
+DEFAULT_TOKEN_LIFETIME = 3600
+TOKEN_REFRESH_MARGIN = 300
+
+# Deadline in seconds of a single attempt of each kind of Rainmaker call
+DEFAULT_TIMEOUTS: dict[str, float] = {"login": 15.0, "list": 30.0, "write": 10.0}
+
+# Deadline in seconds of each kind of Rainmaker call including its retries
+DEFAULT_DEADLINES: dict[str, float] = {"login": 30.0, "list": 60.0, "write": 20.0}
+
+# Retry policy for Rainmaker calls: attempts per call, exponential backoff
+# bounds in seconds, relative jitter and a budget of retries per period
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 0.5
+DEFAULT_RETRY_MAX_DELAY = 30.0
+DEFAULT_RETRY_JITTER = 0.5
+DEFAULT_RETRY_BUDGET = 10
+DEFAULT_RETRY_BUDGET_PERIOD = 60.0
+
+# Circuit breaker: consecutive failures before opening and seconds before a
+# half-open probe is allowed
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_BREAKER_RESET_TIMEOUT = 60.0
+
+# Seconds a debounced write (sliders, setpoint steppers) waits for a newer
+# value of the same param before it is sent
+WRITE_DEBOUNCE = 0.5
+
+# Read-after-write verification: delays in seconds between the node-scoped
+# polls that confirm a write and the overall time to wait for it
+VERIFY_DELAYS = (0.5, 1.0, 2.0, 4.0)
+VERIFY_TIMEOUT = 15.0
+
+# Window in seconds during which parameter writes are coalesced into a
+# single batched set_params request
+DEFAULT_WRITE_WINDOW = 0.1
+
+# Size in bytes of a node list payload above which it is decoded and parsed
+# in an executor instead of on the event loop
+EXECUTOR_PARSE_THRESHOLD = 256 * 1024
+
+# Storage of the last coordinator snapshot used for a non-blocking startup
+STORAGE_VERSION = 1
+# Delay in seconds before a changed snapshot is written to storage
+SNAPSHOT_SAVE_DELAY = 30
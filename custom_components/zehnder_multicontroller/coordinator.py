@@ -1,22 +1,229 @@
 """Data coordinator for Zehnder Multicontroller."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
+import json
 import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from collections.abc import Coroutine
+from datetime import datetime
 from datetime import timedelta
+from typing import Any
+from typing import NamedTuple
+from typing import TypeVar
 
+from homeassistant.const import Platform
+from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import RainmakerAPI
+from .api import RainmakerError
+from .api import RainmakerNodeOfflineError
+from .api import RainmakerTimeoutError
 from .const import DEFAULT_SCAN_INTERVAL
+from .const import DEFAULT_SCHEMA_REFRESH_INTERVAL
+from .const import DOMAIN
+from .const import EXECUTOR_PARSE_THRESHOLD
+from .const import FAST_POLLS_AFTER_WRITE
+from .const import IDLE_BACKOFF_FACTOR
+from .const import MAX_SCAN_INTERVAL
+from .const import MIN_SCAN_INTERVAL
+from .const import NODE_FAILURES_BEFORE_UNAVAILABLE
+from .const import PLATFORMS
+from .const import SNAPSHOT_SAVE_DELAY
+from .const import STORAGE_VERSION
+from .const import VERIFY_DELAYS
+from .const import VERIFY_TIMEOUT
+from .const import WRITE_DEBOUNCE
+from .model import EntityDescriptor
+from .model import NodeState
+from .model import ParamMeta
+from .model import ParamState
+from .model import snapshot_as_dict
+from .model import snapshot_from_dict
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class NodeSchema(NamedTuple):
+    """Cached param metadata of a node."""
+
+    key: str
+    params: tuple[ParamMeta, ...]
+    names: frozenset[str]
+    # Key of the params list alone, shared by nodes with the same firmware
+    params_key: str
+
+
+_T = TypeVar("_T")
+
+# Param metadata of a node and the set of its param names
+_ParamTable = tuple[tuple[ParamMeta, ...], frozenset[str]]
+
+
+class ParamChange(NamedTuple):
+    """A param value that changed between two polls."""
+
+    node_id: str
+    param: str
+    old: Any
+    new: Any
+
+
+class NodeHealth(NamedTuple):
+    """Poll outcome of a single node."""
+
+    # Time of the last poll that returned values for the node
+    last_success: datetime | None
+    consecutive_failures: int
+
+
+class NodeConnectivity(NamedTuple):
+    """Connectivity of a node as reported by the cloud."""
+
+    connected: bool
+    # When the node last connected or disconnected, if reported
+    since: datetime | None
+
+
+class OptimisticValue(NamedTuple):
+    """A written value shown before the cloud reports it."""
+
+    value: Any
+    # Last value reported by the cloud, restored on rollback
+    cloud: Any
+
+
+class _DecodedNodes(NamedTuple):
+    """A nodes payload decoded and split into schemas and values."""
+
+    schemas: dict[str, NodeSchema]
+    tables: dict[str, _ParamTable]
+    values: dict[str, dict[str, Any]]
+    connectivity: dict[str, NodeConnectivity]
+    # Ids of every node of the account, including ones that failed to parse
+    node_ids: set[str]
+    # Nodes sent without a config whose values do not match the cached schema
+    unmatched: set[str]
+
+
+# Creates the entity of a descriptor, or None if it should not get one
+_EntityFactory = Callable[[EntityDescriptor], Entity | None]
+
+
+class _DebouncedWrite:
+    """Latest value of a param waiting to be written and its callers."""
+
+    def __init__(self, value: Any, done: asyncio.Future[None]) -> None:
+        self.value = value
+        self.done = done
+        self.timer: asyncio.TimerHandle | None = None
+
+
+def snapshot_storage_key(entry: Any) -> str:
+    """Return the storage key of the snapshot of a config entry."""
+    return f"{DOMAIN}.{entry.entry_id}.snapshot"
+
+
+def _fingerprint(payload: Any) -> str:
+    """Return a stable hash identifying a node config."""
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def classify_entities(
+    nodes: dict[str, NodeState]
+) -> dict[Platform, list[EntityDescriptor]]:
+    """Sort the params of all nodes into the platforms that expose them."""
+    table: dict[Platform, list[EntityDescriptor]] = {
+        platform: [] for platform in PLATFORMS
+    }
+    for node_id, node in nodes.items():
+        if "temp" in node.params:
+            table[Platform.CLIMATE].append(EntityDescriptor(node_id, None, None))
+        for param, state in node.params.items():
+            # Skip schedules, config, and Name parameters
+            if param == "Name" or param == "config" or "schedule" in param.lower():
+                continue
+            meta = state.meta
+            writable = "write" in meta.properties
+            if meta.data_type == "bool":
+                if writable:
+                    platform = Platform.SWITCH
+                elif "read" in meta.properties:
+                    platform = Platform.BINARY_SENSOR
+                else:
+                    continue
+            elif writable:
+                platform = Platform.NUMBER
+            elif (meta.data_type or "").lower() != "bool":
+                platform = Platform.SENSOR
+            else:
+                continue
+            table[platform].append(EntityDescriptor(node_id, param, meta))
+    return table
+
+
 class RainmakerCoordinator(DataUpdateCoordinator):
-    """Coordinator to fetch Rainmaker nodes and params."""
+    """Coordinator to fetch Rainmaker nodes and params.
+
+    Node configs (param names, bounds, properties, ...) rarely change, so
+    they are cached per node and only fetched on startup, every
+    `DEFAULT_SCHEMA_REFRESH_INTERVAL` seconds or when the returned values no
+    longer match the cached schema. Regular polls only fetch param values.
+
+    Snapshots are `NodeState` objects (see `model`) updated incrementally:
+    param states of unchanged nodes are reused and only values that differ
+    are written. Param metadata is parsed once per schema and shared by
+    every node reporting the same params, e.g. units with the same firmware.
+    Nodes whose schema and param values are the same as in the last poll
+    are skipped altogether (counted in `skipped_node_updates`). The changes
+    of the last poll are available as `last_changes`.
+
+    Node list payloads larger than `executor_parse_threshold` bytes are
+    decoded and parsed in an executor; only merging the result into
+    the snapshot runs on the event loop. `last_poll_loop_time` reports how long
+    the last poll kept the loop busy.
+
+    Listeners subscribe with a `(node_id, param)` context, or `(node_id,
+    None)` for every param of a node. After a successful poll only the
+    listeners whose params changed are called.
+
+    The last snapshot is persisted so that entities can be created from it
+    on startup. Until the first poll succeeds `is_stale` is True.
+
+    The polling interval adapts to activity: after a write the next few
+    polls run at `min_scan_interval`, and every poll that changes nothing
+    stretches the interval towards `max_scan_interval`.
+
+    Nodes are tracked individually: a node that fails to fetch or parse, or
+    is missing from a response, keeps its last known values while the other
+    nodes update. `node_health` records when each node was last fetched and
+    the node becomes unavailable after `NODE_FAILURES_BEFORE_UNAVAILABLE`
+    failed polls in a row.
+
+    Nodes the cloud reports as disconnected (`node_connectivity`) are
+    unavailable and reject writes. Their connectivity comes with every poll,
+    so no extra calls are made to find out when they are back.
+
+    Writes go through `async_set_params`, which confirms them by polling
+    only the written node and merging its values into `data`. Written values
+    are shown optimistically until the cloud reports them and rolled back
+    when the write or its confirmation fails.
+    """
 
     def __init__(
         self, hass: HomeAssistant, api: RainmakerAPI, entry: object | None = None
@@ -24,55 +231,961 @@ class RainmakerCoordinator(DataUpdateCoordinator):
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name="zehnder_multicontroller",
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         )
         self.api = api
         self.entry = entry
+        self.schema_refresh_interval = DEFAULT_SCHEMA_REFRESH_INTERVAL
+        self._schemas: dict[str, NodeSchema] = {}
+        # Param metadata and names shared by all nodes with the same params
+        self._param_tables: dict[str, _ParamTable] = {}
+        self._schema_fetched_at: float | None = None
+        # Nodes listed by the last full fetch, whether they parsed or not
+        self._account_nodes: set[str] | None = None
+        # Nodes dropped from the account whose entities are not removed yet
+        self._removed_nodes: set[str] = set()
+        # Schema key each node of the current snapshot was built from
+        self._snapshot_keys: dict[str, str] = {}
+        # Param values each node last showed in a poll
+        self._last_values: dict[str, dict[str, Any]] = {}
+        # Nodes whose poll was skipped because their values were unchanged,
+        # and nodes whose values were walked
+        self.skipped_node_updates = 0
+        self.applied_node_updates = 0
+        # Node list payloads with more bytes are decoded and parsed off the loop
+        self.executor_parse_threshold = EXECUTOR_PARSE_THRESHOLD
+        self.executor_parses = 0
+        # Seconds the last poll spent parsing and merging on the event loop
+        self.last_poll_loop_time = 0.0
+        self._poll_loop_time = 0.0
+        # Param changes produced by the last successful poll
+        self.last_changes: list[ParamChange] = []
+        # Listener callbacks by id, keyed by their (node_id, param) context
+        self._subscriptions: dict[Any, dict[int, CALLBACK_TYPE]] = {}
+        self._subscription_ids = itertools.count()
+        # Changes of the last poll that listeners have not been told about
+        self._unnotified_changes: list[ParamChange] | None = None
+        self._notified_success: bool | None = None
+        # True while data was restored from storage and not yet refreshed
+        self.is_stale = False
+        self.min_scan_interval: float = MIN_SCAN_INTERVAL
+        self.max_scan_interval: float = MAX_SCAN_INTERVAL
+        self._fast_polls_left = 0
+        self._idle_polls = 0
+        # Writes per node sent by the coordinator and not yet answered
+        self._writes_in_flight: Counter[str] = Counter()
+        # Written values per node awaiting confirmation and their poll tasks
+        self._unverified_writes: dict[str, dict[str, Any]] = {}
+        self._verify_tasks: dict[str, asyncio.Task[None]] = {}
+        # Optimistically shown values per node and param
+        self._optimistic: dict[str, dict[str, OptimisticValue]] = {}
+        self.node_health: dict[str, NodeHealth] = {}
+        self.node_connectivity: dict[str, NodeConnectivity] = {}
+        # Nodes whose availability changed since listeners were last updated
+        self._unnotified_nodes: set[str] = set()
+        # Entity descriptors per platform and the nodes they were built from
+        self._descriptors: dict[Platform, list[EntityDescriptor]] | None = None
+        self._descriptor_nodes: dict[str, NodeState] = {}
+        # Entity factories and add callbacks of the set up platforms, the
+        # entities they created and the descriptors these were synced with
+        self._entity_platforms: dict[
+            Platform, tuple[_EntityFactory, AddEntitiesCallback]
+        ] = {}
+        self._platform_entities: dict[
+            Platform, dict[tuple[str, str | None], Entity]
+        ] = {}
+        self._synced_descriptors: dict[Platform, list[EntityDescriptor]] | None = None
+        # Debounced writes keyed by (node_id, param)
+        self._debounced: dict[tuple[str, str], _DebouncedWrite] = {}
+        self._store: Store[dict[str, Any]] | None = None
+        if entry is not None:
+            self._store = Store(hass, STORAGE_VERSION, snapshot_storage_key(entry))
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending debounced writes and write verifications.
+
+        Callers waiting for a debounced write get a `RainmakerError`.
+        """
+        debounced, self._debounced = self._debounced, {}
+        for (node_id, param), pending in debounced.items():
+            if pending.timer is not None:
+                pending.timer.cancel()
+            if not pending.done.done():
+                pending.done.set_exception(
+                    RainmakerError(f"Write of {param} to node {node_id} cancelled")
+                )
+        for task in list(self._verify_tasks.values()):
+            task.cancel()
+        await super().async_shutdown()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates and index the listener by its context."""
+        remove = super().async_add_listener(update_callback, context)
+        listener_id = next(self._subscription_ids)
+        self._subscriptions.setdefault(context, {})[listener_id] = update_callback
+
+        @callback
+        def remove_listener() -> None:
+            remove()
+            listeners = self._subscriptions.get(context)
+            if listeners is not None:
+                listeners.pop(listener_id, None)
+                if not listeners:
+                    del self._subscriptions[context]
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose params changed in the last poll.
+
+        Listeners of nodes whose availability changed are updated too. All
+        listeners are updated when the change set is unknown (e.g. data set
+        from outside a poll) or when availability of the account changed.
+        """
+        self._async_sync_entities()
+        changes, self._unnotified_changes = self._unnotified_changes, None
+        success_changed = self._notified_success != self.last_update_success
+        self._notified_success = self.last_update_success
+        if changes is None or success_changed:
+            self._unnotified_nodes.clear()
+            super().async_update_listeners()
+            return
+
+        keys: set[Any] = {None}
+        for change in changes:
+            keys.add((change.node_id, change.param))
+            keys.add((change.node_id, None))
+        if self._unnotified_nodes:
+            keys.update(
+                context
+                for context in self._subscriptions
+                if isinstance(context, tuple) and context[0] in self._unnotified_nodes
+            )
+            self._unnotified_nodes.clear()
+        # Listener ids to notify and their context
+        targets = {
+            listener_id: key
+            for key in keys
+            for listener_id in self._subscriptions.get(key, ())
+        }
+        _LOGGER.debug(
+            "Notifying %d of %d listener(s) about %d change(s)",
+            len(targets),
+            sum(map(len, self._subscriptions.values())),
+            len(changes),
+        )
+        for listener_id, key in targets.items():
+            # Skip listeners removed by an earlier one
+            update_callback = self._subscriptions.get(key, {}).get(listener_id)
+            if update_callback is not None:
+                update_callback()
+
+    def entity_descriptors(self, platform: Platform) -> list[EntityDescriptor]:
+        """Return the entities of `platform` for the current snapshot.
+
+        The table of all platforms is built in one pass and reused as long
+        as the snapshot holds the same node objects, which are only rebuilt
+        when a node schema changes.
+        """
+        nodes = self.data or {}
+        built_from = self._descriptor_nodes
+        if (
+            self._descriptors is None
+            or len(built_from) != len(nodes)
+            or any(
+                nodes.get(node_id) is not node for node_id, node in built_from.items()
+            )
+        ):
+            self._descriptors = classify_entities(nodes)
+            self._descriptor_nodes = dict(nodes)
+        return self._descriptors[platform]
+
+    @callback
+    def async_add_entity_platform(
+        self,
+        platform: Platform,
+        create_entity: _EntityFactory,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Add the entities of a platform and keep them in sync with the nodes.
+
+        Entities are created with `create_entity` for the current snapshot.
+        Whenever nodes or their params change later on, entities of new
+        params are added through `async_add_entities` and those of vanished
+        params are removed. Their registry entries are kept, so they show as
+        unavailable and keep their settings should the params come back.
+        Entities of nodes removed from the account are removed together with
+        their registry entries.
+
+        Entities of a restored snapshot are added without an update, which
+        would otherwise block setup on the cloud that the snapshot is there
+        to avoid waiting for.
+        """
+        self._entity_platforms[platform] = (create_entity, async_add_entities)
+        self._platform_entities[platform] = {}
+        self._async_sync_platform(platform, update_before_add=not self.is_stale)
+
+    @callback
+    def _async_sync_entities(self) -> None:
+        """Add and remove entities if the descriptor table changed."""
+        removed_nodes, self._removed_nodes = self._removed_nodes, set()
+        if not self._entity_platforms:
+            return
+        # Rebuilds the table if the snapshot holds different nodes
+        self.entity_descriptors(next(iter(self._entity_platforms)))
+        if self._descriptors is self._synced_descriptors:
+            return
+        for platform in self._entity_platforms:
+            self._async_sync_platform(
+                platform, update_before_add=False, removed_nodes=removed_nodes
+            )
+        self._synced_descriptors = self._descriptors
+
+    @callback
+    def _async_sync_platform(
+        self,
+        platform: Platform,
+        update_before_add: bool,
+        removed_nodes: set[str] | None = None,
+    ) -> None:
+        create_entity, async_add_entities = self._entity_platforms[platform]
+        entities = self._platform_entities[platform]
+        descriptors = {
+            (desc.node_id, desc.param): desc
+            for desc in self.entity_descriptors(platform)
+        }
+        added: list[Entity] = []
+        for key, desc in descriptors.items():
+            if key not in entities and (entity := create_entity(desc)) is not None:
+                entities[key] = entity
+                added.append(entity)
+        for key in entities.keys() - descriptors.keys():
+            entity = entities.pop(key)
+            if removed_nodes and key[0] in removed_nodes:
+                _LOGGER.info("Removing %s entity of removed node %s", platform, key)
+                if entity.registry_entry is not None:
+                    # Removing the entry removes the entity as well
+                    er.async_get(self.hass).async_remove(entity.entity_id)
+                else:
+                    self.hass.async_create_task(entity.async_remove(force_remove=True))
+                continue
+            _LOGGER.info("Removing %s entity of vanished param %s", platform, key)
+            self.hass.async_create_task(entity.async_remove())
+        if added or update_before_add:
+            _LOGGER.debug("Adding %d %s entities", len(added), platform)
+            async_add_entities(added, update_before_add)
+
+    def is_node_connected(self, node_id: str) -> bool:
+        """Return False if the cloud reports the node as disconnected."""
+        connectivity = self.node_connectivity.get(node_id)
+        return connectivity is None or connectivity.connected
+
+    def is_node_available(self, node_id: str) -> bool:
+        """Return False for disconnected nodes or nodes failing to poll."""
+        if not self.is_node_connected(node_id):
+            return False
+        health = self.node_health.get(node_id)
+        return (
+            health is None
+            or health.consecutive_failures < NODE_FAILURES_BEFORE_UNAVAILABLE
+        )
+
+    def _record_node_health(self, node_id: str, success: bool) -> None:
+        """Update the health of a node after a poll."""
+        was_available = self.is_node_available(node_id)
+        health = self.node_health.get(node_id, NodeHealth(None, 0))
+        if success:
+            health = NodeHealth(dt_util.utcnow(), 0)
+        else:
+            health = health._replace(
+                consecutive_failures=health.consecutive_failures + 1
+            )
+        self.node_health[node_id] = health
+        if self.is_node_available(node_id) != was_available:
+            _LOGGER.info(
+                "Node %s is %s",
+                node_id,
+                "available again" if not was_available else "unavailable",
+            )
+            self._unnotified_nodes.add(node_id)
+
+    @callback
+    def async_note_write(self, node_id: str, params: dict[str, Any]) -> None:
+        """Poll fast for a while so the effect of a write shows up quickly.
+
+        Writes that are verified by polling the node itself do not pull in
+        the next full poll.
+        """
+        _LOGGER.debug("Write to node %s, polling fast", node_id)
+        self._fast_polls_left = FAST_POLLS_AFTER_WRITE
+        self._idle_polls = 0
+        self.update_interval = timedelta(seconds=self.min_scan_interval)
+        verified = node_id in self._verify_tasks or self._writes_in_flight[node_id]
+        if self._subscriptions and not verified:
+            # Replace the pending, possibly much later, poll
+            self._schedule_refresh()
+
+    async def async_set_param(
+        self, node_id: str, param: str, value: Any, force: bool = False
+    ) -> None:
+        """Write a single param of a node."""
+        await self.async_set_params(node_id, {param: value}, force=force)
+
+    async def async_set_param_debounced(
+        self, node_id: str, param: str, value: Any
+    ) -> None:
+        """Write a param once its value has settled.
+
+        Only the last value set within `WRITE_DEBOUNCE` seconds is sent; all
+        callers of the burst share the outcome of that write. The value is
+        shown optimistically right away.
+        """
+        key = (node_id, param)
+        pending = self._debounced.get(key)
+        if pending is None:
+            pending = _DebouncedWrite(value, self.hass.loop.create_future())
+            self._debounced[key] = pending
+        else:
+            pending.value = value
+            if pending.timer is not None:
+                pending.timer.cancel()
+        pending.timer = self.hass.loop.call_later(
+            WRITE_DEBOUNCE, self._async_flush_debounced, key
+        )
+        self._async_apply_optimistic(node_id, {param: value})
+        await asyncio.shield(pending.done)
+
+    @callback
+    def _async_flush_debounced(self, key: tuple[str, str]) -> None:
+        pending = self._debounced.pop(key)
+        node_id, param = key
+        self._async_create_background_task(
+            self._async_write_debounced(node_id, param, pending),
+            f"{DOMAIN} debounced write {node_id} {param}",
+        )
+
+    async def _async_write_debounced(
+        self, node_id: str, param: str, pending: _DebouncedWrite
+    ) -> None:
+        try:
+            await self.async_set_params(node_id, {param: pending.value})
+        except Exception as err:
+            pending.done.set_exception(err)
+        else:
+            pending.done.set_result(None)
+        finally:
+            # Cancelled, e.g. when the entry unloads: release the callers
+            if not pending.done.done():
+                pending.done.set_exception(
+                    RainmakerError(f"Write of {param} to node {node_id} cancelled")
+                )
+
+    async def async_set_params(
+        self, node_id: str, params: dict[str, Any], force: bool = False
+    ) -> None:
+        """Write params of a node and confirm them in the background.
+
+        The new values are shown right away through the optimistic overlay
+        and rolled back if the write fails. Writes of values the cloud
+        already reported are skipped unless `force` is set. Writes to
+        disconnected nodes raise `RainmakerNodeOfflineError`.
+        """
+        if not self.is_node_connected(node_id):
+            # Drop values a debounced write may have shown optimistically
+            self._async_rollback(node_id, params)
+            raise RainmakerNodeOfflineError(f"Node {node_id} is offline")
+        if not force and self._is_redundant_write(node_id, params):
+            _LOGGER.debug("Node %s already has %s, skipping write", node_id, params)
+            return
+        self._async_apply_optimistic(node_id, params)
+        self._writes_in_flight[node_id] += 1
+        try:
+            await self.api.async_set_params(node_id, params)
+        except Exception:
+            _LOGGER.error("Writing %s to node %s failed, rolling back", params, node_id)
+            self._async_rollback(node_id, params)
+            raise
+        finally:
+            self._writes_in_flight[node_id] -= 1
+            if not self._writes_in_flight[node_id]:
+                del self._writes_in_flight[node_id]
+        self._async_verify_write(node_id, params)
+
+    def _is_redundant_write(self, node_id: str, params: dict[str, Any]) -> bool:
+        """Return True if the cloud already reported all values of `params`.
+
+        Values restored from storage or still waiting for confirmation do
+        not count. Optimistic values that turn out to match what the cloud
+        reported are dropped from the overlay.
+        """
+        node = (self.data or {}).get(node_id)
+        if node is None or self.is_stale:
+            return False
+        overlay = self._optimistic.get(node_id, {})
+        for name, value in params.items():
+            state = node.params.get(name)
+            if state is None or state.value != value:
+                return False
+            pending = overlay.get(name)
+            if pending is not None and pending.cloud != value:
+                return False
+        for name in params:
+            overlay.pop(name, None)
+        if node_id in self._optimistic and not overlay:
+            del self._optimistic[node_id]
+        return True
+
+    @callback
+    def _async_apply_optimistic(self, node_id: str, params: dict[str, Any]) -> None:
+        """Show written values in `data` until the cloud confirms them."""
+        node = (self.data or {}).get(node_id)
+        if node is None:
+            return
+        self._last_values.pop(node_id, None)
+        overlay = self._optimistic.setdefault(node_id, {})
+        changes: list[ParamChange] = []
+        for name, value in params.items():
+            state = node.params.get(name)
+            if state is None:
+                continue
+            pending = overlay.get(name)
+            cloud = pending.cloud if pending is not None else state.value
+            overlay[name] = OptimisticValue(value, cloud)
+            if state.value != value or type(state.value) is not type(value):
+                changes.append(ParamChange(node_id, name, state.value, value))
+                state.value = value
+        self._async_notify_changes(changes)
+
+    @callback
+    def _async_rollback(self, node_id: str, params: dict[str, Any]) -> None:
+        """Restore the last cloud values of params written optimistically.
+
+        Params overwritten by a later write keep that write's value.
+        """
+        overlay = self._optimistic.get(node_id, {})
+        node = (self.data or {}).get(node_id)
+        self._last_values.pop(node_id, None)
+        changes: list[ParamChange] = []
+        for name, value in params.items():
+            pending = overlay.get(name)
+            if pending is None or pending.value != value:
+                continue
+            del overlay[name]
+            state = node.params.get(name) if node is not None else None
+            if state is not None and state.value != pending.cloud:
+                changes.append(ParamChange(node_id, name, state.value, pending.cloud))
+                state.value = pending.cloud
+        if not overlay:
+            self._optimistic.pop(node_id, None)
+        self._async_notify_changes(changes)
+
+    @callback
+    def _async_verify_write(self, node_id: str, params: dict[str, Any]) -> None:
+        """Poll the written node until it reports `params`.
+
+        Writes to a node that is already being verified join the running
+        verification instead of starting another one.
+        """
+        self._unverified_writes.setdefault(node_id, {}).update(params)
+        if node_id in self._verify_tasks:
+            return
+        self._verify_tasks[node_id] = self._async_create_background_task(
+            self._async_verify_node(node_id), f"{DOMAIN} verify write {node_id}"
+        )
+
+    @callback
+    def _async_create_background_task(
+        self, coro: Coroutine[Any, Any, None], name: str
+    ) -> asyncio.Task[None]:
+        """Run `coro` in a task that is cancelled when the entry unloads."""
+        if self.config_entry is not None:
+            return self.config_entry.async_create_background_task(self.hass, coro, name)
+        return self.hass.async_create_background_task(coro, name)
+
+    async def _async_verify_node(self, node_id: str) -> None:
+        try:
+            confirmed = await self._async_poll_until_confirmed(node_id)
+        finally:
+            expected = self._unverified_writes.pop(node_id, {})
+            self._verify_tasks.pop(node_id, None)
+        if confirmed:
+            _LOGGER.debug("Write to node %s confirmed", node_id)
+            return
+        _LOGGER.error(
+            "Node %s did not confirm written params %s, rolling back",
+            node_id,
+            expected,
+        )
+        self._async_rollback(node_id, expected)
+
+    async def _async_poll_until_confirmed(self, node_id: str) -> bool:
+        try:
+            async with asyncio.timeout(VERIFY_TIMEOUT):
+                for delay in VERIFY_DELAYS:
+                    await asyncio.sleep(delay)
+                    try:
+                        params = await self.api.async_get_node_params(node_id)
+                    except RainmakerError as err:
+                        _LOGGER.debug("Failed to verify write to %s: %s", node_id, err)
+                        continue
+                    values = params.get("multicontrol")
+                    if not isinstance(values, dict):
+                        continue
+                    self._async_merge_node_values(node_id, values)
+                    expected = self._unverified_writes.get(node_id, {})
+                    if all(values.get(k) == v for k, v in expected.items()):
+                        return True
+        except TimeoutError:
+            pass
+        return False
+
+    @callback
+    def _async_merge_node_values(self, node_id: str, values: dict[str, Any]) -> None:
+        """Merge freshly read values of one node into `data`."""
+        node = (self.data or {}).get(node_id)
+        if node is None:
+            return
+        self._last_values.pop(node_id, None)
+        changes, overlay = self._diff_node_values(node_id, node, values)
+        self._apply_node_values(node_id, node, changes, overlay)
+        if changes:
+            self._async_notify_changes(changes)
+            self._schedule_snapshot_save(self.data)
+
+    @callback
+    def _async_notify_changes(self, changes: list[ParamChange]) -> None:
+        """Notify the listeners of `changes` made outside of a poll."""
+        if changes:
+            self._unnotified_changes = changes
+            self.async_update_listeners()
+
+    def _adapt_update_interval(self, changed: bool) -> None:
+        """Pick the interval until the next poll from the last one's outcome."""
+        if self._fast_polls_left:
+            self._fast_polls_left -= 1
+            interval = self.min_scan_interval
+        elif changed:
+            self._idle_polls = 0
+            interval = DEFAULT_SCAN_INTERVAL
+        else:
+            self._idle_polls += 1
+            interval = DEFAULT_SCAN_INTERVAL * IDLE_BACKOFF_FACTOR**self._idle_polls
+        interval = min(self.max_scan_interval, max(self.min_scan_interval, interval))
+        self.update_interval = timedelta(seconds=interval)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last persisted snapshot into `data`.
+
+        Returns True when a snapshot was restored. The data is marked stale
+        until the next successful poll.
+        """
+        if self._store is None:
+            return False
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # pragma: no cover - corrupt storage
+            _LOGGER.warning("Failed to load stored snapshot: %s", err)
+            return False
+
+        nodes = stored.get("nodes") if isinstance(stored, dict) else None
+        if not isinstance(nodes, dict) or not nodes:
+            return False
+
+        try:
+            self.data = snapshot_from_dict(nodes)
+        except (AttributeError, KeyError, TypeError) as err:
+            _LOGGER.warning("Ignoring malformed stored snapshot: %s", err)
+            return False
+        self.is_stale = True
+        _LOGGER.debug("Restored snapshot with %d nodes", len(nodes))
+        return True
 
     async def _ensure_connected(self):
         # Ensure API is connected
         if not getattr(self.api, "is_connected", False):
             _LOGGER.debug("API not connected, attempting reconnect")
-            await self.api.async_connect()
+            try:
+                await self.api.async_connect()
+            except Exception as err:
+                raise UpdateFailed(f"Failed to connect: {err}") from err
 
-    async def _async_update_data(self):
-        await self._ensure_connected()
+    def _schema_is_stale(self) -> bool:
+        if not self._schemas or self._schema_fetched_at is None:
+            return True
+        age = time.monotonic() - self._schema_fetched_at
+        return age >= self.schema_refresh_interval
+
+    def _update_connectivity(self, connectivity: dict[str, NodeConnectivity]) -> None:
+        """Store the connectivity reported by a full fetch."""
+        for node_id in self.node_connectivity.keys() - connectivity.keys():
+            self._set_connectivity(node_id, None)
+        for node_id, state in connectivity.items():
+            self._set_connectivity(node_id, state)
+
+    def _set_connectivity(self, node_id: str, state: NodeConnectivity | None) -> None:
+        """Store the connectivity of a node, None if it is not reported."""
+        connected = state is None or state.connected
+        if connected != self.is_node_connected(node_id):
+            _LOGGER.info("Node %s is %s", node_id, "online" if connected else "offline")
+            self._unnotified_nodes.add(node_id)
+        if state is None:
+            self.node_connectivity.pop(node_id, None)
+        else:
+            self.node_connectivity[node_id] = state
+
+    @staticmethod
+    def _parse_connectivity(status: Any) -> NodeConnectivity | None:
+        """Return the connectivity from the status of a node, if reported."""
         try:
-            nodes = await self.api.async_get_nodes()
+            connectivity = status["connectivity"]
+            connected = bool(connectivity["connected"])
+        except (KeyError, TypeError):
+            return None
+        since = None
+        timestamp = connectivity.get("timestamp")
+        if isinstance(timestamp, (int, float)):
+            # Reported in milliseconds
+            since = dt_util.utc_from_timestamp(timestamp / 1000)
+        return NodeConnectivity(connected, since)
+
+    async def _async_fetch_node_details(self, config: bool) -> _DecodedNodes:
+        """Fetch and decode the details of all nodes, with or without configs."""
+        try:
+            payload = await self.api.async_get_nodes_payload(config=config)
+        except RainmakerTimeoutError as err:
+            _LOGGER.warning("Rainmaker cloud is slow to respond: %s", err)
+            raise UpdateFailed(f"Timed out fetching nodes: {err}") from err
         except Exception as err:
             _LOGGER.error("Failed to fetch nodes: %s", err)
             raise UpdateFailed(f"Failed to fetch nodes: {err}") from err
 
-        if "node_details" not in nodes:
-            _LOGGER.error("API response missing node_details: %s", nodes)
-            raise UpdateFailed(f"API response not in the expected format: {nodes}")
+        try:
+            decoded = await self._async_parse(
+                len(payload),
+                self._decode_node_details,
+                payload,
+                dict(self._schemas),
+                dict(self._param_tables),
+            )
+        except ValueError as err:
+            _LOGGER.error("Failed to decode nodes: %s", err)
+            raise UpdateFailed(f"Failed to decode nodes: {err}") from err
+        if decoded is None:
+            head = payload[:200].decode(errors="replace")
+            _LOGGER.error("API response missing node_details: %s", head)
+            raise UpdateFailed(f"API response not in the expected format: {head}")
+        return decoded
+
+    async def _async_fetch_schema(self) -> dict[str, dict[str, Any]]:
+        """Fetch configs and values of all nodes and refresh the schema cache."""
+        decoded = await self._async_fetch_node_details(config=True)
+        self._schemas = decoded.schemas
+        self._param_tables = decoded.tables
+        self._schema_fetched_at = time.monotonic()
+        self._account_nodes = decoded.node_ids
+        self._update_connectivity(decoded.connectivity)
+        return decoded.values
+
+    async def _async_fetch_values(self) -> dict[str, dict[str, Any]] | None:
+        """Fetch the param values of all nodes in one call, without configs.
+
+        Returns None when the values cannot be matched against the cached
+        schema, e.g. for a node added to the account, in which case the
+        caller should refresh the schema.
+        """
+        decoded = await self._async_fetch_node_details(config=False)
+        if decoded.unmatched:
+            _LOGGER.debug(
+                "Params of nodes %s do not match cached schema",
+                sorted(decoded.unmatched),
+            )
+            return None
+        self._account_nodes = decoded.node_ids
+        self._update_connectivity(decoded.connectivity)
+        return decoded.values
+
+    @classmethod
+    def _decode_node_details(
+        cls,
+        payload: bytes,
+        cached_schemas: dict[str, NodeSchema],
+        cached_tables: dict[str, _ParamTable],
+    ) -> _DecodedNodes | None:
+        """Decode a nodes payload, or return None if it has no node details.
+
+        Only reads its arguments, so it is safe to run in an executor.
+        """
+        nodes = json.loads(payload)
+        if not isinstance(nodes, dict) or "node_details" not in nodes:
+            return None
+        return cls._parse_node_details(
+            nodes["node_details"], cached_schemas, cached_tables
+        )
+
+    @classmethod
+    def _parse_node_details(
+        cls,
+        node_details: list[dict[str, Any]],
+        cached_schemas: dict[str, NodeSchema],
+        cached_tables: dict[str, _ParamTable],
+    ) -> _DecodedNodes:
+        """Split node details into schemas, param values and connectivity.
 
-        nodes_dict = {}
-        for nd in nodes["node_details"]:
+        Nodes sent without a config keep their cached schema if their values
+        match it. Only reads its arguments, so it is safe to run in an
+        executor.
+        """
+        schemas: dict[str, NodeSchema] = {}
+        tables: dict[str, _ParamTable] = {}
+        values: dict[str, dict[str, Any]] = {}
+        connectivity: dict[str, NodeConnectivity] = {}
+        unmatched: set[str] = set()
+        for nd in node_details:
             try:
                 node_id = nd["id"]
-                # params is an array in config.devices[0].params
-                config_params_list = nd["config"]["devices"][0]["params"]
+                state = cls._parse_connectivity(nd.get("status"))
+                if state is not None:
+                    connectivity[node_id] = state
                 param_vals = nd["params"]["multicontrol"]
-
-                transformed_params = {}
-                # Convert the params list to a dict keyed by param name
-                for param_meta in config_params_list:
-                    param_name = param_meta["name"]
-                    transformed_params[param_name] = param_meta.copy()
-                    transformed_params[param_name]["value"] = param_vals.get(param_name)
-
-                nodes_dict[node_id] = transformed_params
-                _LOGGER.debug(
-                    "Processed node %s with %d params", node_id, len(transformed_params)
-                )
-            except (KeyError, IndexError, TypeError) as err:
+                if "config" not in nd:
+                    cached = cached_schemas.get(node_id)
+                    if cached is None or not param_vals.keys() <= cached.names:
+                        unmatched.add(node_id)
+                    else:
+                        schemas[node_id] = cached
+                        values[node_id] = param_vals
+                    continue
+                config = nd["config"]
+                # params is an array in config.devices[0].params
+                config_params_list = config["devices"][0]["params"]
+                key = _fingerprint(config)
+                cached = cached_schemas.get(node_id)
+                if cached is not None and cached.key == key:
+                    schemas[node_id] = cached
+                    tables.setdefault(cached.params_key, (cached.params, cached.names))
+                else:
+                    _LOGGER.debug("Caching new schema for node %s", node_id)
+                    params_key = _fingerprint(config_params_list)
+                    table = tables.get(params_key) or cached_tables.get(params_key)
+                    if table is None:
+                        params = tuple(
+                            ParamMeta.from_config(meta["name"], meta)
+                            for meta in config_params_list
+                        )
+                        table = (params, frozenset(meta.name for meta in params))
+                    tables[params_key] = table
+                    schemas[node_id] = NodeSchema(key, *table, params_key)
+                values[node_id] = param_vals
+            except (AttributeError, KeyError, IndexError, TypeError) as err:
                 _LOGGER.warning(
                     "Failed to process node %s: %s", nd.get("id", "unknown"), err
                 )
                 continue
-        if not nodes_dict:
+        return _DecodedNodes(
+            schemas,
+            tables,
+            values,
+            connectivity,
+            {nd["id"] for nd in node_details if isinstance(nd, dict) and "id" in nd},
+            unmatched,
+        )
+
+    async def _async_parse(self, size: int, func: Callable[..., _T], *args: Any) -> _T:
+        """Run `func` on the loop, or in an executor if `size` is over the threshold.
+
+        Time spent on the loop is added to the loop time of the current poll.
+        """
+        if size > self.executor_parse_threshold:
+            self.executor_parses += 1
+            return await self.hass.async_add_executor_job(func, *args)
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._poll_loop_time += time.perf_counter() - start
+
+    async def _async_update_data(self):
+        await self._ensure_connected()
+
+        self._poll_loop_time = 0.0
+        values = None
+        if not self._schema_is_stale():
+            values = await self._async_fetch_values()
+        if values is None:
+            values = await self._async_fetch_schema()
+
+        start = time.perf_counter()
+        previous: dict[str, NodeState] = self.data or {}
+        nodes_dict: dict[str, NodeState] = {}
+        snapshot_keys: dict[str, str] = {}
+        last_values: dict[str, dict[str, Any]] = {}
+        changes: list[ParamChange] = []
+        # Value changes and overlays of reused nodes, applied once the poll
+        # has succeeded so a failed poll leaves the current snapshot alone
+        updates: list[
+            tuple[str, NodeState, list[ParamChange], dict[str, OptimisticValue]]
+        ] = []
+        rebuilt: list[str] = []
+        for node_id, param_vals in values.items():
+            schema = self._schemas[node_id]
+            node = previous.get(node_id)
+            same_schema = self._snapshot_keys.get(node_id) == schema.key
+            if (
+                node is not None
+                and same_schema
+                and self._last_values.get(node_id) == param_vals
+            ):
+                # Same payload as the last poll: nothing to update or notify
+                self.skipped_node_updates += 1
+            elif node is None or not same_schema:
+                # New node or changed schema: build the node from scratch
+                rebuilt.append(node_id)
+                node = self._build_node(node_id, schema, param_vals)
+                changes.extend(
+                    ParamChange(node_id, name, None, state.value)
+                    for name, state in node.params.items()
+                )
+                _LOGGER.debug("Built node %s with %d params", node_id, len(node))
+                self.applied_node_updates += 1
+            else:
+                # Same schema: reuse the param states and only update values
+                node_changes, overlay = self._diff_node_values(
+                    node_id, node, param_vals
+                )
+                changes.extend(node_changes)
+                updates.append((node_id, node, node_changes, overlay))
+                self.applied_node_updates += 1
+            last_values[node_id] = param_vals
+            nodes_dict[node_id] = node
+            snapshot_keys[node_id] = schema.key
+
+        offline = {
+            node_id for node_id in previous if not self.is_node_connected(node_id)
+        }
+        if not nodes_dict and not offline:
             raise UpdateFailed("No valid nodes found in API response")
 
+        for node_id in nodes_dict:
+            self._record_node_health(node_id, True)
+        # Nodes that failed or are offline keep their last values, nodes the
+        # account no longer lists are dropped
+        listed = self._account_nodes
+        removed: list[str] = []
+        for node_id in previous.keys() - nodes_dict.keys():
+            if listed is not None and node_id not in listed:
+                removed.append(node_id)
+                continue
+            nodes_dict[node_id] = previous[node_id]
+            if node_id in self._snapshot_keys:
+                snapshot_keys[node_id] = self._snapshot_keys[node_id]
+            if node_id in self._last_values:
+                last_values[node_id] = self._last_values[node_id]
+            if node_id not in offline:
+                self._record_node_health(node_id, False)
+
+        for node_id in removed:
+            _LOGGER.info("Node %s was removed from the account", node_id)
+            self.node_health.pop(node_id, None)
+            self.node_connectivity.pop(node_id, None)
+            self._optimistic.pop(node_id, None)
+        self._removed_nodes.update(removed)
+        for node_id in rebuilt:
+            self._optimistic.pop(node_id, None)
+        for update in updates:
+            self._apply_node_values(*update)
+        self._snapshot_keys = snapshot_keys
+        self._last_values = last_values
+        self.last_changes = changes
+        self._unnotified_changes = changes
+        if changes or removed or self.is_stale:
+            self._schedule_snapshot_save(nodes_dict)
+        self.is_stale = False
+        self._adapt_update_interval(bool(changes))
+        self.last_poll_loop_time = self._poll_loop_time + time.perf_counter() - start
+        _LOGGER.debug(
+            "Poll produced %d param change(s) in %.1f ms on the loop, next poll in %s",
+            len(changes),
+            self.last_poll_loop_time * 1000,
+            self.update_interval,
+        )
         return nodes_dict
+
+    def _schedule_snapshot_save(self, nodes: dict[str, NodeState]) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(
+                lambda: {"nodes": self._confirmed_snapshot(nodes)},
+                SNAPSHOT_SAVE_DELAY,
+            )
+
+    def _confirmed_snapshot(
+        self, nodes: dict[str, NodeState]
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the dict form of `nodes` with the values the cloud reported.
+
+        Optimistic values are stored as the cloud value they cover, so a
+        restart never restores a write that was not confirmed.
+        """
+        stored = snapshot_as_dict(nodes)
+        for node_id, overlay in self._optimistic.items():
+            params = stored.get(node_id, {})
+            for name, pending in overlay.items():
+                if name in params:
+                    params[name]["value"] = pending.cloud
+        return stored
+
+    def _diff_node_values(
+        self, node_id: str, node: NodeState, param_vals: dict[str, Any]
+    ) -> tuple[list[ParamChange], dict[str, OptimisticValue]]:
+        """Return the value changes of `node` and its new optimistic overlay.
+
+        Nothing is modified; `_apply_node_values` commits the result.
+        Optimistic values stay in place until the cloud reports them.
+        """
+        overlay = dict(self._optimistic.get(node_id, {}))
+        changes: list[ParamChange] = []
+        for name, state in node.params.items():
+            old = state.value
+            new = param_vals.get(name)
+            pending = overlay.get(name)
+            if pending is not None:
+                if new != pending.value:
+                    overlay[name] = pending._replace(cloud=new)
+                    continue
+                del overlay[name]
+            if new != old or type(new) is not type(old):
+                changes.append(ParamChange(node_id, name, old, new))
+        return changes, overlay
+
+    def _apply_node_values(
+        self,
+        node_id: str,
+        node: NodeState,
+        changes: list[ParamChange],
+        overlay: dict[str, OptimisticValue],
+    ) -> None:
+        """Write `changes` into the param states of `node` in place."""
+        for change in changes:
+            node.params[change.param].value = change.new
+        if overlay:
+            self._optimistic[node_id] = overlay
+        else:
+            self._optimistic.pop(node_id, None)
+
+    @staticmethod
+    def _build_node(
+        node_id: str, schema: NodeSchema, param_vals: dict[str, Any]
+    ) -> NodeState:
+        """Build the state of a node, sharing the metadata of its schema."""
+        return NodeState(
+            node_id,
+            {
+                meta.name: ParamState(meta, param_vals.get(meta.name))
+                for meta in schema.params
+            },
+        )
@@ -0,0 +1,61 @@
+"""Diagnostics support for Zehnder Multicontroller."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD
+from homeassistant.const import CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .model import snapshot_memory_usage
+
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    nodes = coordinator.data or {}
+
+    node_info: dict[str, dict[str, Any]] = {}
+    for node_id, node in nodes.items():
+        health = coordinator.node_health.get(node_id)
+        node_info[node_id] = {
+            "params": len(node),
+            "connected": coordinator.is_node_connected(node_id),
+            "available": coordinator.is_node_available(node_id),
+            "last_success": (
+                health.last_success.isoformat()
+                if health is not None and health.last_success is not None
+                else None
+            ),
+            "consecutive_failures": (
+                health.consecutive_failures if health is not None else 0
+            ),
+        }
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "api": entry_data["api"].stats,
+        "coordinator": {
+            "is_stale": coordinator.is_stale,
+            "skipped_node_updates": coordinator.skipped_node_updates,
+            "applied_node_updates": coordinator.applied_node_updates,
+            "executor_parses": coordinator.executor_parses,
+            "last_poll_loop_time": coordinator.last_poll_loop_time,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval is not None
+                else None
+            ),
+        },
+        "nodes": node_info,
+        "memory": snapshot_memory_usage(nodes),
+    }
@@ -1,4 +1,6 @@
-"""ZehnderMulticontrollerEntity class"""
+"""Base entity classes for Zehnder Multicontroller."""
+from typing import Any
+
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION
@@ -34,3 +36,24 @@ class ZehnderMulticontrollerEntity(CoordinatorEntity):
             "id": str(self.coordinator.data.get("id")),
             "integration": DOMAIN,
         }
+
+
+class RainmakerNodeEntity(CoordinatorEntity):
+    """Base class for entities backed by a Rainmaker node."""
+
+    _node_id: str
+
+    def _param_value(self, param: str) -> Any:
+        """Return the current value of `param` of this node."""
+        node = self.coordinator.data.get(self._node_id)
+        return node.value(param) if node is not None else None
+
+    @property
+    def available(self) -> bool:
+        """Return False when the account or this node failed to update."""
+        return super().available and self.coordinator.is_node_available(self._node_id)
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while the state comes from a restored snapshot."""
+        return self.coordinator.is_stale
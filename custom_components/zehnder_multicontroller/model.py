@@ -0,0 +1,229 @@
+"""Snapshot model of Rainmaker nodes and their params."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+import json
+import sys
+from types import MappingProxyType
+from typing import Any
+from typing import NamedTuple
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ParamMeta(NamedTuple):
+    """Static, read-only metadata of a param.
+
+    Instances are built once per node schema and shared by the param states
+    of every snapshot built from it.
+    """
+
+    name: str
+    data_type: str | None
+    properties: frozenset[str]
+    bounds: Mapping[str, Any] | None
+    ui_type: str | None
+    # Complete metadata as reported by the cloud
+    raw: Mapping[str, Any]
+
+    @classmethod
+    def from_config(cls, name: str, raw: Mapping[str, Any]) -> ParamMeta:
+        """Build from the param metadata of a node config."""
+        raw = {_intern(key): value for key, value in raw.items() if key != "value"}
+        properties = raw.get("properties")
+        bounds = raw.get("bounds")
+        return cls(
+            sys.intern(name),
+            _intern(raw.get("data_type")),
+            (
+                frozenset(map(_intern, properties))
+                if isinstance(properties, (list, tuple, set, frozenset))
+                else frozenset()
+            ),
+            MappingProxyType(dict(bounds)) if isinstance(bounds, Mapping) else None,
+            _intern(raw.get("ui_type")),
+            MappingProxyType(raw),
+        )
+
+
+class ParamState:
+    """Current value of a param together with its shared metadata."""
+
+    __slots__ = ("meta", "value")
+
+    def __init__(self, meta: ParamMeta, value: Any = None) -> None:
+        """Initialize with metadata and an optional value."""
+        self.meta = meta
+        self.value = value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the param in the dict form stored in snapshots."""
+        return {**self.meta.raw, "value": self.value}
+
+    def __repr__(self) -> str:
+        return f"ParamState({self.meta.name!r}, value={self.value!r})"
+
+
+class NodeState(Mapping[str, ParamState]):
+    """Params of a node keyed by name.
+
+    The set of params is fixed, only their values change.
+    """
+
+    __slots__ = ("node_id", "params", "_folded")
+
+    def __init__(self, node_id: str, params: dict[str, ParamState]) -> None:
+        """Initialize with the param states of a node."""
+        self.node_id = node_id
+        self.params = params
+        # Param states keyed by lower-cased name, built on first lookup
+        self._folded: dict[str, ParamState] | None = None
+
+    def __getitem__(self, name: str) -> ParamState:
+        return self.params[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.params)
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def lookup(self, name: str) -> ParamState | None:
+        """Return the param whose lower-cased name is `name`."""
+        if self._folded is None:
+            self._folded = {key.lower(): state for key, state in self.params.items()}
+        return self._folded.get(name)
+
+    def value(self, name: str, default: Any = None) -> Any:
+        """Return the value of param `name`, or `default` if it is unknown."""
+        state = self.params.get(name)
+        return default if state is None else state.value
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the node in the dict form stored in snapshots."""
+        return {name: state.as_dict() for name, state in self.params.items()}
+
+    @classmethod
+    def from_dict(
+        cls,
+        node_id: str,
+        params: Mapping[str, Mapping[str, Any]],
+        metas: Mapping[str, ParamMeta] | None = None,
+    ) -> NodeState:
+        """Build a node from its dict form, e.g. a stored snapshot.
+
+        Metadata found in `metas` is reused instead of being parsed again.
+        """
+        metas = metas or {}
+        return cls(
+            node_id,
+            {
+                sys.intern(name): ParamState(
+                    metas.get(name) or ParamMeta.from_config(name, meta),
+                    meta.get("value"),
+                )
+                for name, meta in params.items()
+            },
+        )
+
+    def __repr__(self) -> str:
+        return f"NodeState({self.node_id!r}, {list(self.params.values())!r})"
+
+
+class EntityDescriptor(NamedTuple):
+    """A param, or a whole node for climate, that backs an entity."""
+
+    node_id: str
+    # None for entities backed by the whole node
+    param: str | None
+    meta: ParamMeta | None
+
+
+def snapshot_from_dict(
+    nodes: Mapping[str, Mapping[str, Mapping[str, Any]]]
+) -> dict[str, NodeState]:
+    """Build a snapshot from its dict form.
+
+    Nodes with identical param metadata share their `ParamMeta` objects.
+    """
+    tables: dict[str, dict[str, ParamMeta]] = {}
+    snapshot: dict[str, NodeState] = {}
+    for node_id, params in nodes.items():
+        key = json.dumps(
+            {
+                name: {k: v for k, v in meta.items() if k != "value"}
+                for name, meta in params.items()
+            },
+            sort_keys=True,
+            default=str,
+        )
+        node = NodeState.from_dict(node_id, params, tables.get(key))
+        tables.setdefault(
+            key, {name: state.meta for name, state in node.params.items()}
+        )
+        snapshot[node_id] = node
+    return snapshot
+
+
+def snapshot_as_dict(
+    nodes: Mapping[str, NodeState]
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Return the dict form of a snapshot, as stored on disk."""
+    return {node_id: node.as_dict() for node_id, node in nodes.items()}
+
+
+def _deep_sizeof(obj: Any, seen: set[int]) -> int:
+    """Return the size of `obj` and the objects it holds not in `seen`."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, MappingProxyType):
+        # The proxy itself is tiny, count the mapping it wraps
+        size += sys.getsizeof(dict(obj))
+    if isinstance(obj, Mapping):
+        children: Iterable[Any] = (*obj.keys(), *obj.values())
+    elif isinstance(obj, (tuple, list, set, frozenset)):
+        children = obj
+    else:
+        return size
+    return size + sum(_deep_sizeof(child, seen) for child in children)
+
+
+def snapshot_memory_usage(nodes: Mapping[str, NodeState]) -> dict[str, int]:
+    """Estimate the memory used by the param metadata of a snapshot.
+
+    `unshared_meta_bytes` is what the metadata would take with a copy per
+    param of every node, as with the former dict snapshots.
+    """
+    metas: dict[int, ParamMeta] = {}
+    param_count = 0
+    value_bytes = 0
+    seen_values: set[int] = set()
+    for node in nodes.values():
+        for state in node.params.values():
+            param_count += 1
+            metas.setdefault(id(state.meta), state.meta)
+            value_bytes += _deep_sizeof(state, seen_values)
+            value_bytes += _deep_sizeof(state.value, seen_values)
+    seen: set[int] = set()
+    meta_bytes = sum(_deep_sizeof(meta, seen) for meta in metas.values())
+    sizes = {key: _deep_sizeof(meta, set()) for key, meta in metas.items()}
+    unshared_meta_bytes = sum(
+        sizes[id(state.meta)]
+        for node in nodes.values()
+        for state in node.params.values()
+    )
+    return {
+        "nodes": len(nodes),
+        "params": param_count,
+        "unique_param_metas": len(metas),
+        "value_bytes": value_bytes,
+        "meta_bytes": meta_bytes,
+        "unshared_meta_bytes": unshared_meta_bytes,
+        "saved_bytes": unshared_meta_bytes - meta_bytes,
+    }
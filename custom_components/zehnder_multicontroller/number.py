@@ -1,24 +1,31 @@
 """Number platform for Zehnder Multicontroller."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
 from functools import cached_property
+from typing import Any
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .api import RainmakerError
 from .const import DOMAIN
+from .entity import RainmakerNodeEntity
+from .model import EntityDescriptor
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class RainmakerParamNumber(CoordinatorEntity, NumberEntity):
+class RainmakerParamNumber(RainmakerNodeEntity, NumberEntity):
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -26,9 +33,10 @@ class RainmakerParamNumber(CoordinatorEntity, NumberEntity):
         node_id: str,
         node_name: str,
         param: str,
-        bounds: dict | None = None,
+        bounds: Mapping[str, Any] | None = None,
     ) -> None:
-        super().__init__(coordinator)
+        # Only get notified when this param changes
+        super().__init__(coordinator, context=(node_id, param))
         self._entry_id = entry_id
         self._node_id = node_id
         self._node_name = node_name
@@ -36,7 +44,9 @@ class RainmakerParamNumber(CoordinatorEntity, NumberEntity):
         self._attr_name = f"{node_name} {param}"
         self._unique_id = f"{entry_id}_{node_id}_{param}"
         # Set bounds from metadata
-        if bounds and isinstance(bounds, dict):
+        if bounds and isinstance(bounds, Mapping):
+            # Param metadata is shared, adjust a copy
+            bounds = dict(bounds)
             if float(bounds.get("min")) == 20.0:
                 bounds["min"] = 18.0  # adjust min temp to 18C
             self._attr_native_min_value = bounds.get("min")
@@ -53,8 +63,7 @@ class RainmakerParamNumber(CoordinatorEntity, NumberEntity):
 
     @property
     def native_value(self) -> float | None:
-        params = self.coordinator.data.get(self._node_id, {})
-        return params.get(self._param, {}).get("value")
+        return self._param_value(self._param)
 
     @cached_property
     def device_info(self) -> DeviceInfo | None:
@@ -65,19 +74,15 @@ class RainmakerParamNumber(CoordinatorEntity, NumberEntity):
         )
 
     async def async_set_native_value(self, value: float) -> None:
-        await self.hass.async_add_executor_job(lambda: None)
         try:
+            # Slider drags produce bursts of values; only the last one is sent
             await self.hass.data[DOMAIN][self._entry_id][
                 "coordinator"
-            ].api.async_set_param(self._node_id, self._param, value)
-        except Exception:  # pragma: no cover - surface errors to logs
-            _LOGGER.exception(
-                "Error setting param %s on node %s", self._param, self._node_id
-            )
-        finally:
-            await self.hass.data[DOMAIN][self._entry_id][
-                "coordinator"
-            ].async_request_refresh()
+            ].async_set_param_debounced(self._node_id, self._param, value)
+        except RainmakerError as err:
+            raise HomeAssistantError(
+                f"Error setting param {self._param} on node {self._node_id}: {err}"
+            ) from err
 
 
 async def async_setup_entry(
@@ -90,21 +95,18 @@ async def async_setup_entry(
 
     coordinator: DataUpdateCoordinator = entry_data["coordinator"]
 
-    entities: list[RainmakerParamNumber] = []
-    for node_id, params in coordinator.data.items():
-        node_name = params.get("Name", {}).get("value", node_id)
-        for param, meta in params.items():
-            # Skip schedules, config, and Name parameters
-            if param == "Name" or param == "config" or "schedule" in param.lower():
-                continue
-            if (
-                "write" in meta.get("properties", [])
-                and meta.get("data_type") != "bool"
-            ):
-                bounds = meta.get("bounds")
-                entity = RainmakerParamNumber(
-                    coordinator, entry.entry_id, node_id, node_name, param, bounds
-                )
-                entities.append(entity)
-
-    async_add_entities(entities, True)
+    @callback
+    def create_entity(desc: EntityDescriptor) -> RainmakerParamNumber:
+        node_name = coordinator.data[desc.node_id].value("Name", desc.node_id)
+        return RainmakerParamNumber(
+            coordinator,
+            entry.entry_id,
+            desc.node_id,
+            node_name,
+            desc.param,
+            desc.meta.bounds,
+        )
+
+    coordinator.async_add_entity_platform(
+        Platform.NUMBER, create_entity, async_add_entities
+    )
@@ -8,18 +8,21 @@ from typing import Any
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
+from .entity import RainmakerNodeEntity
+from .model import EntityDescriptor
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class RainmakerParamSensor(CoordinatorEntity, SensorEntity):
+class RainmakerParamSensor(RainmakerNodeEntity, SensorEntity):
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -28,7 +31,8 @@ class RainmakerParamSensor(CoordinatorEntity, SensorEntity):
         node_name: str,
         param: str,
     ) -> None:
-        super().__init__(coordinator)
+        # Only get notified when this param changes
+        super().__init__(coordinator, context=(node_id, param))
         self._entry_id = entry_id
         self._node_id = node_id
         self._node_name = node_name
@@ -48,8 +52,7 @@ class RainmakerParamSensor(CoordinatorEntity, SensorEntity):
     def native_value(self) -> Any:
         # Do not cache this value — it must reflect the latest
         # coordinator data on every state update.
-        params = self.coordinator.data.get(self._node_id, {})
-        return params.get(self._param, {}).get("value")
+        return self._param_value(self._param)
 
     @cached_property
     def device_info(self) -> DeviceInfo | None:
@@ -70,25 +73,21 @@ async def async_setup_entry(
 
     coordinator: DataUpdateCoordinator = entry_data["coordinator"]
 
-    entities: list[RainmakerParamSensor] = []
-    for node_id, params in coordinator.data.items():
-        node_name = params.get("Name", {}).get("value", node_id)
-        for param, meta in params.items():
-            # Skip schedules, config, and Name parameters
-            if param == "Name" or param == "config" or "schedule" in param.lower():
-                continue
-            dtype = meta.get("data_type", "").lower()
-            if "write" not in meta.get("properties", []) and dtype != "bool":
-                entity = RainmakerParamSensor(
-                    coordinator, entry.entry_id, node_id, node_name, param
-                )
-                # Attach simple metadata-driven attributes
-                if "temp" in param.lower():
-                    entity._attr_native_unit_of_measurement = "°C"
-                    entity._attr_device_class = SensorDeviceClass.TEMPERATURE
-                elif "humidity" in param.lower():
-                    entity._attr_device_class = SensorDeviceClass.HUMIDITY
-
-                entities.append(entity)
-
-    async_add_entities(entities, True)
+    @callback
+    def create_entity(desc: EntityDescriptor) -> RainmakerParamSensor:
+        node_name = coordinator.data[desc.node_id].value("Name", desc.node_id)
+        entity = RainmakerParamSensor(
+            coordinator, entry.entry_id, desc.node_id, node_name, desc.param
+        )
+        # Attach simple metadata-driven attributes
+        param = desc.param.lower()
+        if "temp" in param:
+            entity._attr_native_unit_of_measurement = "°C"
+            entity._attr_device_class = SensorDeviceClass.TEMPERATURE
+        elif "humidity" in param:
+            entity._attr_device_class = SensorDeviceClass.HUMIDITY
+        return entity
+
+    coordinator.async_add_entity_platform(
+        Platform.SENSOR, create_entity, async_add_entities
+    )
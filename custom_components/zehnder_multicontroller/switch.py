@@ -7,18 +7,23 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .api import RainmakerError
 from .const import DOMAIN
+from .entity import RainmakerNodeEntity
+from .model import EntityDescriptor
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class RainmakerParamSwitch(CoordinatorEntity, SwitchEntity):
+class RainmakerParamSwitch(RainmakerNodeEntity, SwitchEntity):
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -27,7 +32,8 @@ class RainmakerParamSwitch(CoordinatorEntity, SwitchEntity):
         node_name: str,
         param: str,
     ) -> None:
-        super().__init__(coordinator)
+        # Only get notified when this param changes
+        super().__init__(coordinator, context=(node_id, param))
         self._entry_id = entry_id
         self._node_id = node_id
         self._node_name = node_name
@@ -45,8 +51,7 @@ class RainmakerParamSwitch(CoordinatorEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        params = self.coordinator.data.get(self._node_id, {})
-        value = params.get(self._param, {}).get("value")
+        value = self._param_value(self._param)
         return bool(value) if value is not None else None
 
     @cached_property
@@ -59,31 +64,23 @@ class RainmakerParamSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         try:
-            await self.hass.data[DOMAIN][self._entry_id][
-                "coordinator"
-            ].api.async_set_param(self._node_id, self._param, True)
-        except Exception:  # pragma: no cover - surface errors to logs
-            _LOGGER.exception(
-                "Error turning on %s on node %s", self._param, self._node_id
+            await self.hass.data[DOMAIN][self._entry_id]["coordinator"].async_set_param(
+                self._node_id, self._param, True
             )
-        finally:
-            await self.hass.data[DOMAIN][self._entry_id][
-                "coordinator"
-            ].async_request_refresh()
+        except RainmakerError as err:
+            raise HomeAssistantError(
+                f"Error turning on {self._param} on node {self._node_id}: {err}"
+            ) from err
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         try:
-            await self.hass.data[DOMAIN][self._entry_id][
-                "coordinator"
-            ].api.async_set_param(self._node_id, self._param, False)
-        except Exception:  # pragma: no cover - surface errors to logs
-            _LOGGER.exception(
-                "Error turning off %s on node %s", self._param, self._node_id
+            await self.hass.data[DOMAIN][self._entry_id]["coordinator"].async_set_param(
+                self._node_id, self._param, False
             )
-        finally:
-            await self.hass.data[DOMAIN][self._entry_id][
-                "coordinator"
-            ].async_request_refresh()
+        except RainmakerError as err:
+            raise HomeAssistantError(
+                f"Error turning off {self._param} on node {self._node_id}: {err}"
+            ) from err
 
 
 async def async_setup_entry(
@@ -96,19 +93,13 @@ async def async_setup_entry(
 
     coordinator: DataUpdateCoordinator = entry_data["coordinator"]
 
-    entities: list[RainmakerParamSwitch] = []
-    for node_id, params in coordinator.data.items():
-        node_name = params.get("Name", {}).get("value", node_id)
-        for param, meta in params.items():
-            # Skip schedules, config, and Name parameters
-            if param == "Name" or param == "config" or "schedule" in param.lower():
-                continue
-            if meta.get("data_type") == "bool" and "write" in meta.get(
-                "properties", []
-            ):
-                entity = RainmakerParamSwitch(
-                    coordinator, entry.entry_id, node_id, node_name, param
-                )
-                entities.append(entity)
-
-    async_add_entities(entities, True)
+    @callback
+    def create_entity(desc: EntityDescriptor) -> RainmakerParamSwitch:
+        node_name = coordinator.data[desc.node_id].value("Name", desc.node_id)
+        return RainmakerParamSwitch(
+            coordinator, entry.entry_id, desc.node_id, node_name, desc.param
+        )
+
+    coordinator.async_add_entity_platform(
+        Platform.SWITCH, create_entity, async_add_entities
+    )
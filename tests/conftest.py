@@ -1,4 +1,5 @@
 """Global fixtures for Zehnder Multicontroller integration."""
+import json
 from unittest.mock import patch
 
 import pytest
@@ -63,8 +64,10 @@ def fixture_dummy_api():
     """Provide a simple DummyAPI class for tests.
 
     The class accepts an optional `nodes` kwarg to control what
-    `async_get_nodes` returns. It also exposes `async_set_param` as an
-    AsyncMock to make assertions about calls.
+    `async_get_nodes` returns; `async_get_nodes_payload` returns it encoded
+    as JSON, without node configs for `config=False`. It also exposes
+    `async_set_param` and `async_set_params` as AsyncMocks to make
+    assertions about calls.
     """
     from unittest.mock import AsyncMock
 
@@ -73,6 +76,7 @@ def fixture_dummy_api():
             self._nodes = nodes if nodes is not None else {"node_details": []}
             self.is_connected = False
             self.async_set_param = AsyncMock()
+            self.async_set_params = AsyncMock()
 
         async def async_connect(self):
             self.is_connected = True
@@ -80,9 +84,27 @@ def fixture_dummy_api():
         async def async_get_nodes(self):
             return self._nodes
 
+        async def async_get_nodes_payload(self, config=True):
+            nodes = await self.async_get_nodes()
+            if not config and isinstance(nodes.get("node_details"), list):
+                nodes = {
+                    **nodes,
+                    "node_details": [
+                        {key: val for key, val in nd.items() if key != "config"}
+                        for nd in nodes["node_details"]
+                    ],
+                }
+            return json.dumps(nodes).encode()
+
         async def async_close(self):
             self.is_connected = False
 
+        async def async_shutdown(self):
+            await self.async_close()
+
+        def async_add_write_listener(self, listener):
+            return lambda: None
+
     return _DummyAPI
 
 
@@ -90,11 +112,19 @@ def fixture_dummy_api():
 def fixture_dummy_coordinator():
     """Provide a simple DummyCoordinator class for tests.
 
-    Instances have a `data` dict, an `api` attribute, and an
+    Instances have a `data` snapshot, an `api` attribute, and an
     `async_request_refresh` AsyncMock so platform entities can call it.
+    `data` may be assigned in the stored dict form and is converted to
+    `NodeState` objects like the real coordinator's snapshot.
+    Writes are passed straight through to `api` without verification.
     """
     from unittest.mock import AsyncMock
 
+    from custom_components.zehnder_multicontroller.coordinator import (
+        classify_entities,
+    )
+    from custom_components.zehnder_multicontroller.model import snapshot_from_dict
+
     class _DummyCoordinator:
         def __init__(self, *args, data=None, **kwargs):
             # Accept either a data dict directly (positional) or the usual
@@ -110,8 +140,49 @@ def fixture_dummy_coordinator():
             self.data = data or {}
             self.async_request_refresh = AsyncMock()
             self.api = None
+            self.is_stale = False
+
+        @property
+        def data(self):
+            return self._data
+
+        @data.setter
+        def data(self, data):
+            # Leave data that is not a node snapshot (e.g. {"id": 1}) as is
+            if all(isinstance(params, dict) for params in data.values()):
+                data = snapshot_from_dict(data)
+            self._data = data
 
         async def async_config_entry_first_refresh(self):
             return None
 
+        async def async_shutdown(self):
+            return None
+
+        def async_note_write(self, node_id, params):
+            return None
+
+        def is_node_available(self, node_id):
+            return True
+
+        def entity_descriptors(self, platform):
+            return classify_entities(self.data)[platform]
+
+        def async_add_entity_platform(self, platform, create_entity, add_entities):
+            entities = [
+                entity
+                for desc in self.entity_descriptors(platform)
+                if (entity := create_entity(desc)) is not None
+            ]
+            add_entities(entities, not self.is_stale)
+
+        async def async_set_param(self, node_id, param, value, force=False):
+            await self.api.async_set_param(node_id, param, value)
+
+        async def async_set_params(self, node_id, params, force=False):
+            await self.api.async_set_params(node_id, params)
+
+        async def async_set_param_debounced(self, node_id, param, value):
+            await self.api.async_set_param(node_id, param, value)
+
     return _DummyCoordinator
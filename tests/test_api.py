@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+import json
 
 import pytest
 from custom_components.zehnder_multicontroller import api as api_module
 
 
 class DummyClient:
-    def __init__(self, host: str) -> None:
+    def __init__(self, host: str, session=None) -> None:
         self.host = host
         self._closed = False
 
@@ -16,39 +17,73 @@ class DummyClient:
         if username == "bad":
             raise Exception("auth failed")
 
-    async def async_get_nodes(self, node_details: bool = False) -> dict:
-        await asyncio.sleep(0)
-        return {
-            "node_details": [
-                {
-                    "id": "n1",
-                    "params": {"multicontrol": {"p": 1}},
-                    "config": {"devices": [{"params": [{"name": "p"}]}]},
-                }
-            ]
-        }
-
     async def async_set_params(self, batch):
         return [{"node_id": batch[0]["node_id"], "status": "success"}]
 
-    async def async_close(self):
+    async def close(self):
         self._closed = True
 
 
+class DummyResponse:
+    def __init__(self, status: int, data) -> None:
+        self.status = status
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def json(self, content_type=None):
+        return self._data
+
+    async def read(self) -> bytes:
+        return json.dumps(self._data).encode()
+
+
+class DummySession:
+    """HTTP session answering the requests rainmaker-http does not wrap."""
+
+    def __init__(self, login_status: int = 200) -> None:
+        self.login_status = login_status
+        self.headers = []
+
+    async def post(self, url, json=None):
+        if self.login_status != 200:
+            return DummyResponse(self.login_status, {"status": "failure"})
+        return DummyResponse(200, {"status": "success", "accesstoken": "token"})
+
+    async def get(self, url, headers=None, params=None):
+        await asyncio.sleep(0)
+        self.headers.append(headers)
+        return DummyResponse(
+            200,
+            {
+                "node_details": [
+                    {
+                        "id": "n1",
+                        "params": {"multicontrol": {"p": 1}},
+                        "config": {"devices": [{"params": [{"name": "p"}]}]},
+                    }
+                ]
+            },
+        )
+
+
 @pytest.mark.asyncio
 async def test_rainmaker_api_connect_and_get_nodes(monkeypatch):
-    """Test that RainmakerAPI connects and fetches nodes using the internal client."""
+    """Test that RainmakerAPI connects and fetches the node list payload."""
 
     # Patch the external RainmakerClient to our dummy
     monkeypatch.setattr(api_module, "RainmakerClient", DummyClient)
 
     api = api_module.RainmakerAPI(None, "https://host/", "user", "pass")
+    api._session = DummySession()
     await api.async_connect()
     assert api.is_connected
 
-    nodes = await api.async_get_nodes()
+    nodes = json.loads(await api.async_get_nodes_payload())
     assert "node_details" in nodes
     assert nodes["node_details"][0]["id"] == "n1"
+    assert api._session.headers == [{"Authorization": "token"}]
 
 
 @pytest.mark.asyncio
@@ -63,26 +98,15 @@ async def test_rainmaker_api_set_param_and_close(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_async_get_nodes_wrong_format(monkeypatch):
-    class BadClient:
-        def __init__(self, host: str) -> None:
-            self.host = host
-
-        async def async_login(self, username: str, password: str) -> None:
-            return None
-
-        async def async_get_nodes(self, node_details: bool = False) -> dict:
-            return {"unexpected": []}
-
-        async def async_close(self):
-            return None
-
-    monkeypatch.setattr(api_module, "RainmakerClient", BadClient)
+async def test_async_get_nodes_payload_login_rejected(monkeypatch):
+    monkeypatch.setattr(api_module, "RainmakerClient", DummyClient)
 
     api = api_module.RainmakerAPI(None, "https://host/", "user", "pass")
+    api._session = DummySession(login_status=401)
     await api.async_connect()
     with pytest.raises(api_module.RainmakerError):
-        await api.async_get_nodes()
+        await api.async_get_nodes_payload()
+    assert api._session.headers == []
 
 
 def test_async_set_param_not_connected():
@@ -1,11 +1,16 @@
 """Extra unit tests for the Rainmaker API adapter."""
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from aiohttp import ClientError
+from aiohttp import ClientResponseError
 from custom_components.zehnder_multicontroller import api as api_mod
 from custom_components.zehnder_multicontroller.api import RainmakerAPI
 from custom_components.zehnder_multicontroller.api import RainmakerAuthError
+from custom_components.zehnder_multicontroller.api import RainmakerCircuitBreaker
+from custom_components.zehnder_multicontroller.api import RainmakerCircuitOpenError
 from custom_components.zehnder_multicontroller.api import RainmakerConnectionError
 from custom_components.zehnder_multicontroller.api import RainmakerError
 
@@ -13,7 +18,7 @@ from custom_components.zehnder_multicontroller.api import RainmakerError
 @pytest.mark.asyncio
 async def test_async_connect_success(monkeypatch):
     class DummyClient:
-        def __init__(self, host):
+        def __init__(self, host, session=None):
             self.host = host
 
         async def async_login(self, username, password):
@@ -29,7 +34,7 @@ async def test_async_connect_success(monkeypatch):
 @pytest.mark.asyncio
 async def test_async_connect_network_error(monkeypatch):
     class DummyClient:
-        def __init__(self, host):
+        def __init__(self, host, session=None):
             pass
 
         async def async_login(self, username, password):
@@ -45,7 +50,7 @@ async def test_async_connect_network_error(monkeypatch):
 @pytest.mark.asyncio
 async def test_async_connect_auth_error(monkeypatch):
     class DummyClient:
-        def __init__(self, host):
+        def __init__(self, host, session=None):
             pass
 
         async def async_login(self, username, password):
@@ -59,55 +64,74 @@ async def test_async_connect_auth_error(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_async_get_nodes_success():
-    class GoodClient:
-        async def async_get_nodes(self, node_details=True):
-            return {"node_details": [{"id": "n1"}]}
+async def test_async_get_node_params_reconnect(monkeypatch):
+    class BadClient:
+        async def async_login(self, username, password):
+            raise RuntimeError("rejected")
 
-    api = RainmakerAPI(None, "h", "u", "p")
-    api._client = GoodClient()
-    api._connected = True
+        async def async_get_params(self, node_id):
+            raise RuntimeError("unauthorized") from ClientResponseError(
+                None, (), status=401
+            )
 
-    data = await api.async_get_nodes()
-    assert "node_details" in data
+        async def close(self):
+            return None
 
+    class GoodClient:
+        async def async_get_params(self, node_id):
+            return {"multicontrol": {"p1": 1}}
 
-@pytest.mark.asyncio
-async def test_async_get_nodes_reconnect(monkeypatch):
-    class BadClient:
-        async def async_get_nodes(self, node_details=True):
-            raise RuntimeError("boom")
+    async def fake_sleep(delay):
+        return None
 
-    class GoodClient:
-        async def async_get_nodes(self, node_details=True):
-            return {"node_details": [{"id": "n1"}]}
+    monkeypatch.setattr(api_mod.asyncio, "sleep", fake_sleep)
 
     api = RainmakerAPI(None, "h", "u", "p")
     api._client = BadClient()
     api._connected = True
+    reconnects = []
 
-    async def fake_reconnect():
+    async def fake_reconnect(attempts=None):
+        reconnects.append(attempts)
         api._client = GoodClient()
         api._connected = True
 
-    monkeypatch.setattr(api, "_reconnect", fake_reconnect)
+    monkeypatch.setattr(api, "_async_reconnect_now", fake_reconnect)
 
-    data = await api.async_get_nodes()
-    assert "node_details" in data
+    # The refused token is renewed; the rejected renewal drops the client
+    # and the next retry rebuilds it with a single login
+    data = await api.async_get_node_params("n1")
+    assert data == {"multicontrol": {"p1": 1}}
+    assert reconnects == [1]
+    assert api.stats["rejections"] == 1
 
 
 @pytest.mark.asyncio
-async def test_async_get_nodes_missing_node_details():
+async def test_transient_failures_are_retried_without_login(monkeypatch):
+    async def fake_sleep(delay):
+        return None
+
+    monkeypatch.setattr(api_mod.asyncio, "sleep", fake_sleep)
+    logins = []
+    fetches = []
+
     class Client:
-        async def async_get_nodes(self, node_details=True):
-            return {}
+        async def async_login(self, username, password):
+            logins.append(True)
+
+        async def async_get_params(self, node_id):
+            fetches.append(node_id)
+            if len(fetches) < 3:
+                raise RuntimeError("503") from ClientResponseError(None, (), status=503)
+            return {"multicontrol": {"p1": 1}}
 
     api = RainmakerAPI(None, "h", "u", "p")
     api._client = Client()
     api._connected = True
 
-    with pytest.raises(RainmakerError):
-        await api.async_get_nodes()
+    assert await api.async_get_node_params("n1") == {"multicontrol": {"p1": 1}}
+    assert len(fetches) == 3
+    assert logins == []
 
 
 @pytest.mark.asyncio
@@ -160,7 +184,7 @@ async def test_async_set_param_client_raises():
 @pytest.mark.asyncio
 async def test_async_close_handles_error():
     class Client:
-        async def async_close(self):
+        async def close(self):
             raise ClientError("close fail")
 
     api = RainmakerAPI(None, "h", "u", "p")
@@ -171,3 +195,545 @@ async def test_async_close_handles_error():
     await api.async_close()
     assert api._client is None
     assert api.is_connected is False
+
+
+@pytest.mark.asyncio
+async def test_async_set_param_coalesces_writes():
+    import asyncio
+
+    batches = []
+
+    class Client:
+        async def async_set_params(self, batch):
+            batches.append(batch)
+            return [
+                {
+                    "node_id": item["node_id"],
+                    "status": "failure" if item["node_id"] == "n2" else "success",
+                }
+                for item in batch
+            ]
+
+    api = RainmakerAPI(None, "h", "u", "p", write_window=0)
+    api._client = Client()
+    api._connected = True
+
+    results = await asyncio.gather(
+        api.async_set_param("n1", "a", 1),
+        api.async_set_param("n1", "b", 2),
+        api.async_set_param("n2", "a", 3),
+        return_exceptions=True,
+    )
+
+    # All writes are sent in a single multi-node request
+    assert len(batches) == 1
+    assert batches[0] == [
+        {"node_id": "n1", "payload": {"multicontrol": {"a": 1, "b": 2}}},
+        {"node_id": "n2", "payload": {"multicontrol": {"a": 3}}},
+    ]
+    # Each caller gets the result of its own node
+    assert results[0] is None and results[1] is None
+    assert isinstance(results[2], RainmakerError)
+
+
+@pytest.mark.asyncio
+async def test_write_listeners_see_accepted_writes():
+    api = RainmakerAPI(None, "h", "u", "p", write_window=0)
+    api._connected = True
+
+    class Client:
+        async def async_set_params(self, batch):
+            return [
+                {"node_id": "n1", "status": "success"},
+                {"node_id": "n2", "status": "failure"},
+            ]
+
+    api._client = Client()
+    seen = []
+    remove = api.async_add_write_listener(
+        lambda node_id, params: seen.append((node_id, params))
+    )
+
+    results = await asyncio.gather(
+        api.async_set_param("n1", "a", 1),
+        api.async_set_param("n2", "b", 2),
+        return_exceptions=True,
+    )
+    assert isinstance(results[1], RainmakerError)
+    assert seen == [("n1", {"a": 1})]
+
+    remove()
+    await api.async_set_param("n1", "a", 3)
+    assert seen == [("n1", {"a": 1})]
+
+
+@pytest.mark.asyncio
+async def test_async_set_params_single_payload():
+    batches = []
+
+    class Client:
+        async def async_set_params(self, batch):
+            batches.append(batch)
+            return [{"node_id": "n1", "status": "success"}]
+
+    api = RainmakerAPI(None, "h", "u", "p", write_window=0)
+    api._client = Client()
+    api._connected = True
+
+    await api.async_set_params("n1", {"season": 1, "radiant_enabled": True})
+    assert batches == [
+        [
+            {
+                "node_id": "n1",
+                "payload": {"multicontrol": {"season": 1, "radiant_enabled": True}},
+            }
+        ]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_get_node_params():
+    class Client:
+        async def async_get_params(self, nodeid):
+            if nodeid == "bad":
+                raise RuntimeError("boom")
+            return {"multicontrol": {"p": 1}}
+
+    api = RainmakerAPI(None, "h", "u", "p")
+    api._client = Client()
+    api._connected = True
+
+    assert await api.async_get_node_params("n1") == {"multicontrol": {"p": 1}}
+    with pytest.raises(RainmakerConnectionError):
+        await api.async_get_node_params("bad")
+
+
+@pytest.mark.asyncio
+async def test_expiring_token_renews_session_on_same_client(monkeypatch):
+    logins = []
+
+    class Client:
+        def __init__(self, host, session=None):
+            self.reject = False
+
+        async def async_login(self, username, password):
+            if self.reject:
+                raise RuntimeError("rejected")
+            logins.append(self)
+
+        async def async_get_params(self, nodeid):
+            return {"multicontrol": {}}
+
+    monkeypatch.setattr(api_mod, "RainmakerClient", Client)
+
+    api = RainmakerAPI(None, "h", "u", "p")
+    await api.async_connect()
+    client = api._client
+    assert api.token_expires_in > 0
+
+    # Close to expiry the session is renewed without rebuilding the client
+    api.token_lifetime = 0
+    api._token_expires_at = 0
+    await api.async_get_node_params("n1")
+    assert api._client is client
+    assert logins == [client, client]
+
+    # A rejected renewal drops the client; the next call rebuilds it
+    client.reject = True
+    with pytest.raises(RainmakerAuthError):
+        await api.async_get_node_params("n1")
+    assert api._client is None
+    assert len(logins) == 2
+
+    await api.async_get_node_params("n1")
+    assert api._client is not client
+    assert len(logins) == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reconnects_share_one_login(monkeypatch):
+    import asyncio
+
+    clients = []
+
+    class Client:
+        def __init__(self, host, session=None):
+            clients.append(self)
+
+        async def async_login(self, username, password):
+            await asyncio.sleep(0)
+
+        async def close(self):
+            return None
+
+    monkeypatch.setattr(api_mod, "RainmakerClient", Client)
+
+    api = RainmakerAPI(None, "h", "u", "p")
+    await asyncio.gather(*(api._reconnect() for _ in range(5)))
+
+    assert len(clients) == 1
+    assert api.is_connected
+
+    # A later reconnect starts a new attempt
+    await api._reconnect()
+    assert len(clients) == 2
+
+
+@pytest.mark.asyncio
+async def test_calls_back_off_and_open_circuit(monkeypatch):
+    from custom_components.zehnder_multicontroller.api import RainmakerRetryPolicy
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(api_mod.asyncio, "sleep", fake_sleep)
+
+    api = RainmakerAPI(
+        None,
+        "h",
+        "u",
+        "p",
+        retry_policy=RainmakerRetryPolicy(attempts=3, base_delay=1, jitter=0),
+        circuit_breaker=RainmakerCircuitBreaker(failure_threshold=4, reset_timeout=60),
+    )
+    api._connected = True
+    api._token_expires_at = None
+    calls = []
+
+    async def flaky():
+        calls.append(True)
+        raise ClientError("down")
+
+    with pytest.raises(ClientError):
+        await api._async_call("list", flaky)
+    assert len(calls) == 3
+    assert delays == [1, 2]
+    assert api.stats["retries"] == 2
+
+    # The fourth consecutive failure opens the breaker and stops retrying
+    with pytest.raises(ClientError):
+        await api._async_call("list", flaky)
+    assert len(calls) == 4
+    assert api.stats["circuit_state"] == "open"
+
+    with pytest.raises(RainmakerCircuitOpenError):
+        await api._async_call("list", flaky)
+    assert len(calls) == 4
+    assert api.stats["short_circuited"] == 1
+
+    # After the reset timeout a single probe closes the breaker again
+    api.circuit_breaker._opened_at -= 60
+
+    async def ok():
+        return "ok"
+
+    assert await api._async_call("list", ok) == "ok"
+    assert api.stats["circuit_state"] == "closed"
+    assert api.stats["consecutive_failures"] == 0
+
+
+@pytest.mark.asyncio
+async def test_auth_errors_are_not_retried():
+    api = RainmakerAPI(None, "h", "u", "p")
+    calls = []
+
+    async def rejected():
+        calls.append(True)
+        raise RainmakerAuthError("bad credentials")
+
+    with pytest.raises(RainmakerAuthError):
+        await api._async_call("login", rejected)
+    assert len(calls) == 1
+    assert api.stats["total_failures"] == 0
+    assert api.stats["total_successes"] == 0
+    assert api.stats["rejections"] == 1
+
+
+@pytest.mark.asyncio
+async def test_login_transport_errors_are_retried(monkeypatch):
+    from rainmaker_http.exceptions import RainmakerConnectionError as HttpError
+
+    async def fake_sleep(delay):
+        return None
+
+    monkeypatch.setattr(api_mod.asyncio, "sleep", fake_sleep)
+    logins = []
+
+    class Client:
+        def __init__(self, host, session=None):
+            pass
+
+        async def async_login(self, username, password):
+            logins.append(True)
+            if len(logins) < 3:
+                raise HttpError("Login transport error") from ClientError("reset")
+
+        async def close(self):
+            return None
+
+    monkeypatch.setattr(api_mod, "RainmakerClient", Client)
+
+    api = RainmakerAPI(None, "h", "u", "p")
+    with pytest.raises(RainmakerConnectionError):
+        await api.async_connect()
+    assert api.stats["total_failures"] == 1
+
+    await api._reconnect()
+    assert len(logins) == 3
+    assert api.is_connected
+
+
+@pytest.mark.asyncio
+async def test_rejected_login_is_an_auth_error(monkeypatch):
+    from rainmaker_http.client import RainmakerClient as RealClient
+
+    logins = []
+
+    class Response:
+        status = 401
+
+        async def text(self):
+            return '{"status": "failure"}'
+
+    class Session:
+        async def post(self, url, json=None, headers=None, timeout=None):
+            logins.append(url)
+            return Response()
+
+    monkeypatch.setattr(
+        api_mod,
+        "RainmakerClient",
+        lambda host, session=None: RealClient(host, session=Session()),
+    )
+
+    api = RainmakerAPI(None, "https://api.example/v1", "u", "wrong")
+    with pytest.raises(RainmakerAuthError):
+        await api.async_connect()
+    # Not retried and not counted against the circuit breaker
+    assert len(logins) == 1
+    assert api.stats["total_failures"] == 0
+    assert api.stats["rejections"] == 1
+
+
+@pytest.mark.asyncio
+async def test_adapters_of_a_host_share_one_session(monkeypatch):
+    from types import SimpleNamespace
+
+    class Session:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    class Client:
+        def __init__(self, host, session=None):
+            self.session = session
+
+        async def async_login(self, username, password):
+            return None
+
+        async def close(self):
+            return None
+
+    monkeypatch.setattr(api_mod, "RainmakerClient", Client)
+    monkeypatch.setattr(
+        api_mod, "async_create_clientsession", lambda hass, **kwargs: Session()
+    )
+
+    hass = SimpleNamespace(data={})
+    first = RainmakerAPI(hass, "h", "u1", "p")
+    second = RainmakerAPI(hass, "h/", "u2", "p")
+    other = RainmakerAPI(hass, "other", "u1", "p")
+    for api in (first, second, other):
+        await api.async_connect()
+
+    session = first._client.session
+    assert second._client.session is session
+    assert other._client.session is not session
+
+    # The session stays open until the last adapter of the host is shut down
+    await first.async_shutdown()
+    assert not session.closed
+    await second.async_shutdown()
+    assert session.closed
+    assert not other._client.session.closed
+
+
+@pytest.mark.asyncio
+async def test_calls_past_their_deadline_time_out():
+    import asyncio
+
+    from custom_components.zehnder_multicontroller.api import RainmakerRetryPolicy
+    from custom_components.zehnder_multicontroller.api import RainmakerTimeoutError
+
+    api = RainmakerAPI(
+        None,
+        "h",
+        "u",
+        "p",
+        retry_policy=RainmakerRetryPolicy(attempts=2, base_delay=0),
+        timeouts={"list": 0.01},
+    )
+    cancelled = []
+
+    async def hang():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(RainmakerTimeoutError):
+        await api._async_call("list", hang)
+    # Every attempt was cancelled at its deadline
+    assert cancelled == [True, True]
+    assert api.timeouts["write"] > 0
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_at_the_call_deadline():
+    import asyncio
+
+    from custom_components.zehnder_multicontroller.api import RainmakerRetryPolicy
+    from custom_components.zehnder_multicontroller.api import RainmakerTimeoutError
+
+    api = RainmakerAPI(
+        None,
+        "h",
+        "u",
+        "p",
+        retry_policy=RainmakerRetryPolicy(attempts=10, base_delay=0),
+        timeouts={"list": 0.05},
+        deadlines={"list": 0.08},
+    )
+    calls = []
+
+    async def hang():
+        calls.append(True)
+        await asyncio.sleep(10)
+
+    with pytest.raises(RainmakerTimeoutError):
+        await api._async_call("list", hang)
+    # The second attempt is cut short by the deadline of the whole call
+    assert len(calls) == 2
+    assert api.stats["total_failures"] == 2
+
+
+@pytest.mark.asyncio
+async def test_session_renewal_runs_under_timeout_and_breaker(monkeypatch):
+    import asyncio
+
+    from custom_components.zehnder_multicontroller.api import RainmakerTimeoutError
+
+    class Client:
+        async def async_login(self, username, password):
+            await asyncio.sleep(10)
+
+    api = RainmakerAPI(None, "h", "u", "p", timeouts={"login": 0.01})
+    client = Client()
+    api._client = client
+    api._connected = True
+
+    with pytest.raises(RainmakerTimeoutError):
+        await api._async_refresh_session()
+    # A renewal that did not get an answer keeps the client
+    assert api._client is client
+    assert api.stats["total_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_close_uses_the_client_close_api():
+    from rainmaker_http.client import RainmakerClient as RealClient
+
+    class Session:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    api = RainmakerAPI(None, "h", "u", "p")
+    session = Session()
+    api._client = RealClient("h", session=session)
+    api._connected = True
+
+    await api.async_close()
+    assert api._client is None
+    # The client does not own, and so does not close, a pooled session
+    assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_async_get_nodes_payload_is_not_decoded():
+    requests = []
+    logins = []
+    payload = b'{"node_details": [{"id": "n1"}]}'
+
+    class Response:
+        def __init__(self, status, body=b""):
+            self.status = status
+            self._body = body
+
+        def raise_for_status(self):
+            if self.status != 200:
+                raise ClientResponseError(None, (), status=self.status)
+
+        async def json(self, content_type=None):
+            return {"status": "success", "accesstoken": f"token{len(logins)}"}
+
+        async def read(self):
+            return self._body
+
+    class Session:
+        status = 200
+
+        async def post(self, url, json=None):
+            logins.append((url, json))
+            return Response(200)
+
+        async def get(self, url, headers=None, params=None):
+            requests.append((url, headers, params))
+            if self.status is None:
+                raise ClientError("down")
+            return Response(self.status, payload)
+
+    api = RainmakerAPI(
+        None,
+        "https://api.example/v1",
+        "u",
+        "p",
+        retry_policy=api_mod.RainmakerRetryPolicy(attempts=1),
+    )
+    session = Session()
+    api._session = session
+    api._client = object()
+    api._connected = True
+
+    # The adapter logs in for a token of its own, once
+    assert await api.async_get_nodes_payload() == payload
+    assert logins == [
+        ("https://api.example/v1/login2", {"user_name": "u", "password": "p"})
+    ]
+    assert requests[0] == (
+        "https://api.example/v1/user/nodes",
+        {"Authorization": "token1"},
+        {"node_details": "true"},
+    )
+    # Value polls leave the node configs out
+    await api.async_get_nodes_payload(config=False)
+    assert requests[1][2] == {"node_details": "true", "config": "false"}
+    assert len(logins) == 1
+
+    # A refused token is dropped and replaced by the next request
+    session.status = 401
+    with pytest.raises(RainmakerConnectionError):
+        await api.async_get_nodes_payload()
+    session.status = 200
+    await api.async_get_nodes_payload()
+    assert len(logins) == 2
+    assert requests[-1][1] == {"Authorization": "token2"}
+
+    session.status = None
+    with pytest.raises(RainmakerConnectionError):
+        await api.async_get_nodes_payload()
@@ -6,6 +6,7 @@ from custom_components.zehnder_multicontroller.climate import async_setup_entry
 from custom_components.zehnder_multicontroller.climate import DEFAULT_FAN_NAMES
 from custom_components.zehnder_multicontroller.climate import ZehnderClimate
 from custom_components.zehnder_multicontroller.const import DOMAIN
+from homeassistant.components.climate import HVACMode
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 
@@ -161,18 +162,18 @@ async def test_async_setters_and_features(DummyCoordinator, DummyAPI):
     # async_set_temperature should call API and request refresh
     await ent.async_set_temperature(temperature=24.0)
     api.async_set_param.assert_any_call("n1", "temp_setpoint", 24.0)
-    coord.async_request_refresh.assert_awaited()
+    coord.async_request_refresh.assert_not_awaited()
 
     # async_set_hvac_mode transitions
     await ent.async_set_hvac_mode("off")
     await ent.async_set_hvac_mode("heat")
     await ent.async_set_hvac_mode("cool")
-    coord.async_request_refresh.assert_awaited()
+    coord.async_request_refresh.assert_not_awaited()
 
     # async_set_fan_mode invalid then valid
     await ent.async_set_fan_mode("invalid")
     await ent.async_set_fan_mode(ent.fan_modes[0])
-    coord.async_request_refresh.assert_awaited()
+    coord.async_request_refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -221,3 +222,33 @@ async def test_async_setup_entry_registry_behavior(DummyCoordinator, monkeypatch
     added.clear()
     await async_setup_entry(hass, entry, add)
     assert len(added) == 1
+
+
+def test_derived_attributes_follow_node_schema(DummyCoordinator):
+    data = {
+        "n1": {
+            "TEMP": {"value": 20.5},
+            "Season": {"value": 2},
+            "radiant_enabled": {"value": True},
+            "fan_speed": {"value": 1, "bounds": {"min": 0, "max": 3}},
+        }
+    }
+    coord = DummyCoordinator(data)
+    ent = ZehnderClimate(coord, "e1", "n1", "Node")
+    calls = []
+    original = ent._initialize_fan_names
+    ent._initialize_fan_names = lambda: calls.append(True) or original()
+
+    # Params are matched ignoring case
+    assert ent.current_temperature == 20.5
+    assert ent.hvac_mode == HVACMode.COOL
+    coord.data["n1"]["fan_speed"].value = 2
+    assert ent.fan_mode == "Medium"
+    # Value changes keep the derived attributes
+    assert calls == []
+
+    # A rebuilt node (new schema) recomputes them
+    data["n1"]["fan_speed"]["bounds"] = {"min": 0, "max": 2}
+    coord.data = data
+    assert ent.fan_modes == ["0", "1", "2"]
+    assert calls == [True]
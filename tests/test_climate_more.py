@@ -107,7 +107,7 @@ async def test_supported_features_and_setters(DummyCoordinator, DummyAPI):
     # Test async_set_temperature triggers api and refresh
     await c.async_set_temperature(temperature=21)
     api.async_set_param.assert_called_with("n", "temp_setpoint", 21)
-    coord.async_request_refresh.assert_awaited()
+    coord.async_request_refresh.assert_not_awaited()
 
     # Test async_set_hvac_mode transitions
     api.async_set_param.reset_mock()
@@ -115,11 +115,16 @@ async def test_supported_features_and_setters(DummyCoordinator, DummyAPI):
     api.async_set_param.assert_called()
     api.async_set_param.reset_mock()
     await c.async_set_hvac_mode(HVACMode.HEAT.value)
-    # Should set season then radiant
-    assert any(call.args[1] == "season" for call in api.async_set_param.mock_calls)
-    api.async_set_param.reset_mock()
+    # Should set season and radiant in a single write
+    api.async_set_params.assert_awaited_once_with(
+        "n", {"season": 1, "radiant_enabled": True}
+    )
+    api.async_set_params.reset_mock()
     await c.async_set_hvac_mode(HVACMode.COOL.value)
-    assert any(call.args[1] == "season" for call in api.async_set_param.mock_calls)
+    api.async_set_params.assert_awaited_once_with(
+        "n", {"season": 2, "radiant_enabled": True}
+    )
+    api.async_set_param.assert_not_called()
 
     # Test async_set_fan_mode unknown does nothing
     api.async_set_param.reset_mock()
@@ -26,6 +26,9 @@ async def test_validate_input_auth_error(monkeypatch, hass):
         async def async_connect(self):
             raise Exception("auth")
 
+        async def async_shutdown(self):
+            return None
+
     monkeypatch.setattr(
         "custom_components.zehnder_multicontroller.config_flow.RainmakerAPI", BadAPI
     )
@@ -1,6 +1,8 @@
 """Unit tests for RainmakerCoordinator."""
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 from custom_components.zehnder_multicontroller.coordinator import RainmakerCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
@@ -19,24 +21,18 @@ async def test_coordinator_success(hass, DummyAPI):
     }
 
     api = DummyAPI(nodes=nodes)
-    # Avoid calling the DataUpdateCoordinator __init__ which tries to
-    # inspect the current frame for a config entry. Create the instance
-    # without running __init__ and set the needed attributes manually.
-    coord = object.__new__(RainmakerCoordinator)
-    coord.api = api
-    coord.entry = None
+    # Pass a bare namespace as hass; the coordinator only stores it.
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
 
     data = await RainmakerCoordinator._async_update_data(coord)
     assert "n1" in data
-    assert data["n1"]["p1"]["value"] == 1
+    assert data["n1"]["p1"].value == 1
 
 
 @pytest.mark.asyncio
 async def test_coordinator_missing_node_details(hass, DummyAPI):
     api = DummyAPI(nodes={"unexpected": []})
-    coord = object.__new__(RainmakerCoordinator)
-    coord.api = api
-    coord.entry = None
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
 
     with pytest.raises(UpdateFailed):
         await RainmakerCoordinator._async_update_data(coord)
@@ -1,10 +1,13 @@
 """Extra tests for coordinator to cover connect and error paths."""
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
 from custom_components.zehnder_multicontroller.coordinator import RainmakerCoordinator
+from custom_components.zehnder_multicontroller.model import snapshot_from_dict
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 
@@ -30,9 +33,7 @@ async def test_update_data_raises_on_api_error(DummyAPI):
 
     api.async_get_nodes = _bad
 
-    coord = object.__new__(RainmakerCoordinator)
-    coord.api = api
-    coord.entry = None
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
 
     with pytest.raises(UpdateFailed):
         await RainmakerCoordinator._async_update_data(coord)
@@ -44,9 +45,7 @@ async def test_update_data_no_valid_nodes(DummyAPI):
     nodes = {"node_details": [{"id": "n1", "params": {}, "config": {}}]}
     api = DummyAPI(nodes=nodes)
 
-    coord = object.__new__(RainmakerCoordinator)
-    coord.api = api
-    coord.entry = None
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
 
     with pytest.raises(UpdateFailed):
         await RainmakerCoordinator._async_update_data(coord)
@@ -61,3 +60,826 @@ def test_coordinator_init_with_hass(hass, DummyAPI, monkeypatch):
     api = DummyAPI()
     coord = RainmakerCoordinator(hass, api)
     assert coord.api is api
+
+
+@pytest.mark.asyncio
+async def test_update_data_reuses_cached_schema(DummyAPI):
+    config = {"devices": [{"params": [{"name": "p1"}]}]}
+    nodes = {
+        "node_details": [
+            {"id": "n1", "params": {"multicontrol": {"p1": 1}}, "config": config}
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    api.async_get_nodes_payload = AsyncMock(side_effect=api.async_get_nodes_payload)
+
+    def fetched_configs():
+        return [
+            call.kwargs["config"]
+            for call in api.async_get_nodes_payload.await_args_list
+        ]
+
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+
+    # First poll fetches configs, the next one only values
+    data = await coord._async_update_data()
+    assert data["n1"].value("p1") == 1
+    nodes["node_details"][0]["params"]["multicontrol"]["p1"] = 2
+    data = await coord._async_update_data()
+    assert data["n1"].value("p1") == 2
+    assert fetched_configs() == [True, False]
+
+    # Values that do not match the cached schema trigger a config refresh
+    nodes["node_details"][0]["params"]["multicontrol"]["new"] = 1
+    config["devices"][0]["params"].append({"name": "new"})
+    data = await coord._async_update_data()
+    assert data["n1"].value("new") == 1
+    assert fetched_configs() == [True, False, False, True]
+
+    # Stale schemas are refreshed as well
+    coord.schema_refresh_interval = 0
+    await coord._async_update_data()
+    assert fetched_configs() == [True, False, False, True, True]
+
+
+@pytest.mark.asyncio
+async def test_value_polls_use_a_single_call(DummyAPI):
+    nodes = {
+        "node_details": [
+            {
+                "id": f"n{i}",
+                "params": {"multicontrol": {"p1": 1}},
+                "config": {"devices": [{"params": [{"name": "p1"}]}]},
+            }
+            for i in range(20)
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    api.async_get_nodes_payload = AsyncMock(side_effect=api.async_get_nodes_payload)
+    api.async_get_node_params = AsyncMock()
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+    coord.data = await coord._async_update_data()
+
+    for nd in nodes["node_details"]:
+        nd["params"]["multicontrol"]["p1"] = 2
+    data = await coord._async_update_data()
+    assert all(node.value("p1") == 2 for node in data.values())
+    assert api.async_get_nodes_payload.await_count == 2
+    api.async_get_nodes_payload.assert_awaited_with(config=False)
+    api.async_get_node_params.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_data_timeout_does_not_refetch_schema(DummyAPI):
+    from custom_components.zehnder_multicontroller.api import RainmakerTimeoutError
+
+    nodes = {
+        "node_details": [
+            {
+                "id": "n1",
+                "params": {"multicontrol": {"p1": 1}},
+                "config": {"devices": [{"params": [{"name": "p1"}]}]},
+            }
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    get_payload = api.async_get_nodes_payload
+
+    async def get_values_slowly(config=True):
+        if not config:
+            raise RainmakerTimeoutError("slow")
+        return await get_payload(config)
+
+    api.async_get_nodes_payload = AsyncMock(side_effect=get_values_slowly)
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+
+    coord.data = await coord._async_update_data()
+    with pytest.raises(UpdateFailed, match="Timed out"):
+        await coord._async_update_data()
+    assert api.async_get_nodes_payload.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_interval_adapts_to_writes_and_idle_polls(DummyAPI):
+    nodes = {
+        "node_details": [
+            {
+                "id": "n1",
+                "params": {"multicontrol": {"p1": 1}},
+                "config": {"devices": [{"params": [{"name": "p1"}]}]},
+            }
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+    coord.min_scan_interval = 10
+    coord.max_scan_interval = 300
+
+    # Unchanged polls back off up to the ceiling
+    coord.data = await coord._async_update_data()
+    intervals = []
+    for _ in range(4):
+        coord.data = await coord._async_update_data()
+        intervals.append(coord.update_interval.total_seconds())
+    assert intervals == sorted(intervals)
+    assert intervals[0] > 120
+    assert intervals[-1] == 300
+
+    # A write switches to fast polls, then back to the default interval
+    coord.async_note_write("n1", {"p1": 2})
+    assert coord.update_interval.total_seconds() == 10
+    nodes["node_details"][0]["params"]["multicontrol"]["p1"] = 2
+    for _ in range(3):
+        coord.data = await coord._async_update_data()
+        assert coord.update_interval.total_seconds() == 10
+    coord.data = await coord._async_update_data()
+    assert coord.update_interval.total_seconds() > 120
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_debounced_writes(DummyAPI):
+    from custom_components.zehnder_multicontroller.api import RainmakerError
+
+    loop = asyncio.get_running_loop()
+    api = DummyAPI()
+    coord = RainmakerCoordinator(SimpleNamespace(loop=loop), api)
+    coord.update_interval = None
+    coord.data = snapshot_from_dict({"n1": {"p1": {"name": "p1", "value": 1}}})
+    verify = loop.create_task(asyncio.sleep(10))
+    coord._verify_tasks["n1"] = verify
+
+    write = loop.create_task(coord.async_set_param_debounced("n1", "p1", 2))
+    await asyncio.sleep(0)
+    timer = coord._debounced[("n1", "p1")].timer
+
+    await coord.async_shutdown()
+    with pytest.raises(RainmakerError, match="cancelled"):
+        await write
+    assert timer.cancelled()
+    assert not coord._debounced
+    await asyncio.sleep(0)
+    assert verify.cancelled()
+    api.async_set_params.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_debounced_write_releases_its_callers(DummyAPI):
+    from custom_components.zehnder_multicontroller.api import RainmakerError
+
+    loop = asyncio.get_running_loop()
+    tasks = []
+
+    def create_task(coro, name):
+        tasks.append(loop.create_task(coro))
+        return tasks[-1]
+
+    hass = SimpleNamespace(loop=loop, async_create_background_task=create_task)
+    api = DummyAPI()
+    sent = asyncio.Event()
+
+    async def send(node_id, params):
+        await sent.wait()
+
+    api.async_set_params = AsyncMock(side_effect=send)
+    coord = RainmakerCoordinator(hass, api)
+    coord.update_interval = None
+    coord.data = snapshot_from_dict({"n1": {"p1": {"name": "p1", "value": 1}}})
+
+    write = loop.create_task(coord.async_set_param_debounced("n1", "p1", 2))
+    await asyncio.sleep(0)
+    coord._debounced[("n1", "p1")].timer.cancel()
+    coord._async_flush_debounced(("n1", "p1"))
+    await asyncio.sleep(0)
+    api.async_set_params.assert_awaited_once()
+
+    # The entry unloads while the write is being sent
+    tasks[0].cancel()
+    with pytest.raises(RainmakerError, match="cancelled"):
+        await asyncio.wait_for(write, 1)
+
+
+@pytest.mark.asyncio
+async def test_verified_writes_do_not_trigger_a_full_refresh(DummyAPI):
+    from unittest.mock import MagicMock
+
+    api = DummyAPI()
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+    coord._schedule_refresh = MagicMock()
+    coord.async_add_listener(lambda: None)
+    coord._schedule_refresh.reset_mock()
+    coord.data = snapshot_from_dict({"n1": {"p1": {"name": "p1", "value": 1}}})
+    coord._async_verify_write = MagicMock()
+
+    # The write listener fires while the coordinator's own write is in flight
+    api.async_set_params.side_effect = coord.async_note_write
+    await coord.async_set_params("n1", {"p1": 2})
+    coord._schedule_refresh.assert_not_called()
+    assert not coord._writes_in_flight
+
+    # Writes the coordinator does not verify still refresh right away
+    coord.async_note_write("n1", {"p1": 3})
+    coord._schedule_refresh.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_write_is_verified_by_polling_the_node(DummyAPI, monkeypatch):
+    from custom_components.zehnder_multicontroller import coordinator as coord_mod
+
+    monkeypatch.setattr(coord_mod, "VERIFY_DELAYS", (0, 0, 0))
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        loop=loop,
+        async_create_background_task=lambda coro, name: loop.create_task(coro),
+    )
+    api = DummyAPI()
+    api.async_get_nodes = AsyncMock()
+    api.async_get_node_params = AsyncMock(
+        side_effect=[{"multicontrol": {"p1": 1}}, {"multicontrol": {"p1": 2}}]
+    )
+    coord = RainmakerCoordinator(hass, api)
+    coord.update_interval = None
+    coord.data = snapshot_from_dict({"n1": {"p1": {"name": "p1", "value": 1}}})
+    notified = []
+    coord.async_add_listener(lambda: notified.append(True), ("n1", "p1"))
+
+    await coord.async_set_param("n1", "p1", 2)
+    api.async_set_params.assert_awaited_once_with("n1", {"p1": 2})
+    await coord._verify_tasks["n1"]
+
+    # Only the written node was polled until it reported the new value
+    assert coord.data["n1"]["p1"].value == 2
+    assert api.async_get_node_params.await_count == 2
+    api.async_get_nodes.assert_not_awaited()
+    assert notified == [True]
+    assert not coord._verify_tasks
+
+
+@pytest.mark.asyncio
+async def test_optimistic_write_is_rolled_back(DummyAPI, monkeypatch):
+    from custom_components.zehnder_multicontroller import coordinator as coord_mod
+    from custom_components.zehnder_multicontroller.api import RainmakerError
+
+    monkeypatch.setattr(coord_mod, "VERIFY_DELAYS", (0, 0))
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        loop=loop,
+        async_create_background_task=lambda coro, name: loop.create_task(coro),
+    )
+    api = DummyAPI()
+    coord = RainmakerCoordinator(hass, api)
+    coord.update_interval = None
+    coord.data = snapshot_from_dict({"n1": {"p1": {"name": "p1", "value": 1}}})
+    seen = []
+    coord.async_add_listener(
+        lambda: seen.append(coord.data["n1"]["p1"].value), ("n1", "p1")
+    )
+
+    # The new value is shown before the write finishes
+    async def failing_write(node_id, params):
+        assert coord.data["n1"]["p1"].value == 2
+        raise RainmakerError("rejected")
+
+    api.async_set_params = AsyncMock(side_effect=failing_write)
+    with pytest.raises(RainmakerError):
+        await coord.async_set_param("n1", "p1", 2)
+    assert seen == [2, 1]
+    assert not coord._optimistic
+
+    # A write the node never confirms is rolled back to the reported value
+    api.async_set_params = AsyncMock()
+    api.async_get_node_params = AsyncMock(return_value={"multicontrol": {"p1": 1}})
+    await coord.async_set_param("n1", "p1", 3)
+    assert coord.data["n1"]["p1"].value == 3
+    await coord._verify_tasks["n1"]
+    assert coord.data["n1"]["p1"].value == 1
+    assert seen == [2, 1, 3, 1]
+    assert not coord._optimistic
+
+
+@pytest.mark.asyncio
+async def test_debounced_writes_send_only_the_last_value(DummyAPI, monkeypatch):
+    from custom_components.zehnder_multicontroller import coordinator as coord_mod
+
+    monkeypatch.setattr(coord_mod, "WRITE_DEBOUNCE", 0.01)
+    monkeypatch.setattr(coord_mod, "VERIFY_DELAYS", (0,))
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        loop=loop,
+        async_create_background_task=lambda coro, name: loop.create_task(coro),
+    )
+    api = DummyAPI()
+    api.async_get_node_params = AsyncMock(return_value={"multicontrol": {"p1": 4}})
+    coord = RainmakerCoordinator(hass, api)
+    coord.update_interval = None
+    coord.data = snapshot_from_dict({"n1": {"p1": {"name": "p1", "value": 1}}})
+
+    async def set_later(value, delay):
+        await asyncio.sleep(delay)
+        await coord.async_set_param_debounced("n1", "p1", value)
+        assert coord.data["n1"]["p1"].value in (value, 4)
+
+    await asyncio.gather(set_later(2, 0), set_later(3, 0.005), set_later(4, 0.008))
+
+    # Every caller waited for the single write of the final value
+    api.async_set_params.assert_awaited_once_with("n1", {"p1": 4})
+    assert not coord._debounced
+
+
+@pytest.mark.asyncio
+async def test_redundant_writes_are_skipped(DummyAPI):
+    api = DummyAPI()
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+    coord._async_verify_write = lambda node_id, params: None
+    coord.data = snapshot_from_dict({"n1": {"p1": {"name": "p1", "value": 1}}})
+
+    await coord.async_set_param("n1", "p1", 1)
+    api.async_set_params.assert_not_awaited()
+
+    # Forced writes and values restored from storage are always sent
+    await coord.async_set_param("n1", "p1", 1, force=True)
+    assert api.async_set_params.await_count == 1
+    coord.is_stale = True
+    await coord.async_set_param("n1", "p1", 1)
+    assert api.async_set_params.await_count == 2
+
+    # An unconfirmed value does not count as known state
+    coord.is_stale = False
+    await coord.async_set_param("n1", "p1", 2)
+    assert api.async_set_params.await_count == 3
+    await coord.async_set_param("n1", "p1", 2)
+    assert api.async_set_params.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_node_keeps_last_known_values(DummyAPI, monkeypatch):
+    from custom_components.zehnder_multicontroller import coordinator as coord_mod
+
+    monkeypatch.setattr(coord_mod, "NODE_FAILURES_BEFORE_UNAVAILABLE", 2)
+    config = {"devices": [{"params": [{"name": "p1"}]}]}
+    nodes = {
+        "node_details": [
+            {"id": node_id, "params": {"multicontrol": {"p1": 1}}, "config": config}
+            for node_id in ("n1", "n2")
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    coord = RainmakerCoordinator(
+        SimpleNamespace(loop=asyncio.get_running_loop()), api
+    )
+    coord.update_interval = None
+    coord.data = await coord._async_update_data()
+    coord.async_update_listeners()
+    notified = []
+    coord.async_add_listener(lambda: notified.append("n1"), ("n1", "p1"))
+    coord.async_add_listener(lambda: notified.append("n2"), ("n2", "p1"))
+
+    # n2 is still listed but its values cannot be read
+    nodes["node_details"][0]["params"]["multicontrol"]["p1"] = 2
+    nodes["node_details"][1]["params"] = {}
+    last_success = coord.node_health["n2"].last_success
+
+    # The failing node keeps its values while the healthy one updates
+    coord.data = await coord._async_update_data()
+    coord.async_update_listeners()
+    assert coord.data["n1"]["p1"].value == 2
+    assert coord.data["n2"]["p1"].value == 1
+    assert coord.node_health["n2"].last_success == last_success
+    assert coord.is_node_available("n2")
+    assert notified == ["n1"]
+
+    # Repeated failures make only that node unavailable
+    coord.data = await coord._async_update_data()
+    coord.async_update_listeners()
+    assert not coord.is_node_available("n2")
+    assert coord.is_node_available("n1")
+    assert notified == ["n1", "n2"]
+
+
+@pytest.mark.asyncio
+async def test_offline_nodes_are_unavailable_and_skipped(DummyAPI):
+    from custom_components.zehnder_multicontroller.api import (
+        RainmakerNodeOfflineError,
+    )
+
+    config = {"devices": [{"params": [{"name": "p1"}]}]}
+    nodes = {
+        "node_details": [
+            {
+                "id": node_id,
+                "params": {"multicontrol": {"p1": 1}},
+                "config": config,
+                "status": {
+                    "connectivity": {"connected": connected, "timestamp": 1700000000000}
+                },
+            }
+            for node_id, connected in (("n1", True), ("n2", False))
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    api.async_get_nodes_payload = AsyncMock(side_effect=api.async_get_nodes_payload)
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+    coord.data = await coord._async_update_data()
+
+    assert coord.is_node_available("n1")
+    assert not coord.is_node_available("n2")
+    assert coord.node_connectivity["n2"].since.year == 2023
+
+    # Offline nodes reject writes without a cloud call
+    with pytest.raises(RainmakerNodeOfflineError):
+        await coord.async_set_param("n2", "p1", 5)
+    api.async_set_params.assert_not_awaited()
+
+    # The offline node keeps its values without counting as failed
+    coord.data = await coord._async_update_data()
+    assert coord.data["n2"].value("p1") == 1
+    assert coord.node_health["n2"].consecutive_failures == 0
+
+    # Connectivity comes with every value poll, so a node that is back is
+    # noticed without refetching the schema
+    nodes["node_details"][1]["status"]["connectivity"]["connected"] = True
+    nodes["node_details"][1]["params"]["multicontrol"]["p1"] = 2
+    coord.data = await coord._async_update_data()
+    assert coord.is_node_available("n2")
+    assert coord.data["n2"].value("p1") == 2
+    configs = [call.kwargs["config"] for call in api.async_get_nodes_payload.mock_calls]
+    assert configs == [True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_update_data_is_incremental(DummyAPI):
+    from custom_components.zehnder_multicontroller.coordinator import ParamChange
+
+    nodes = {
+        "node_details": [
+            {
+                "id": "n1",
+                "params": {"multicontrol": {"p1": 1, "p2": "a"}},
+                "config": {"devices": [{"params": [{"name": "p1"}, {"name": "p2"}]}]},
+            }
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+
+    coord.data = await coord._async_update_data()
+    assert set(coord.last_changes) == {
+        ParamChange("n1", "p1", None, 1),
+        ParamChange("n1", "p2", None, "a"),
+    }
+    p2_meta = coord.data["n1"]["p2"]
+    nodes["node_details"][0]["params"]["multicontrol"]["p1"] = 2
+
+    data = await coord._async_update_data()
+    # Only the changed value is reported and unchanged params are reused
+    assert coord.last_changes == [ParamChange("n1", "p1", 1, 2)]
+    assert data["n1"]["p2"] is p2_meta
+    assert p2_meta.meta is coord._schemas["n1"].params[1]
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_leaves_the_snapshot_alone(DummyAPI):
+    from custom_components.zehnder_multicontroller.coordinator import ParamChange
+
+    nodes = {
+        "node_details": [
+            {
+                "id": "n1",
+                "params": {"multicontrol": {"p1": 1, "p2": 1}},
+                "config": {"devices": [{"params": [{"name": "p1"}, {"name": "p2"}]}]},
+            }
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+    coord.data = await coord._async_update_data()
+    nodes["node_details"][0]["params"]["multicontrol"] = {"p1": 2, "p2": 3}
+    coord._async_apply_optimistic("n1", {"p2": 5})
+    overlay = dict(coord._optimistic["n1"])
+
+    def fail(node_id, success):
+        raise RuntimeError("boom")
+
+    coord._record_node_health = fail
+    with pytest.raises(RuntimeError):
+        await coord._async_update_data()
+    assert coord.data["n1"]["p1"].value == 1
+    assert coord._optimistic["n1"] == overlay
+
+    del coord._record_node_health
+    await coord._async_update_data()
+    assert coord.last_changes == [ParamChange("n1", "p1", 1, 2)]
+    assert coord.data["n1"]["p1"].value == 2
+    assert coord._optimistic["n1"]["p2"].cloud == 3
+
+
+@pytest.mark.asyncio
+async def test_update_listeners_only_notifies_changed_params():
+    import asyncio
+
+    from custom_components.zehnder_multicontroller.coordinator import ParamChange
+
+    hass = SimpleNamespace(loop=asyncio.get_running_loop())
+    coord = RainmakerCoordinator(hass, None)
+    coord.update_interval = None
+
+    calls = []
+    coord.async_add_listener(lambda: calls.append("p1"), ("n1", "p1"))
+    remove_p2 = coord.async_add_listener(lambda: calls.append("p2"), ("n1", "p2"))
+    coord.async_add_listener(lambda: calls.append("node"), ("n1", None))
+    coord.async_add_listener(lambda: calls.append("other"), ("n2", None))
+
+    # Without a known change set every listener is updated
+    coord.async_update_listeners()
+    assert sorted(calls) == ["node", "other", "p1", "p2"]
+
+    calls.clear()
+    coord._unnotified_changes = [ParamChange("n1", "p1", 1, 2)]
+    coord.async_update_listeners()
+    assert sorted(calls) == ["node", "p1"]
+
+    # Removed listeners are dropped from the index
+    calls.clear()
+    remove_p2()
+    coord._unnotified_changes = [ParamChange("n1", "p2", 1, 2)]
+    coord.async_update_listeners()
+    assert calls == ["node"]
+    assert ("n1", "p2") not in coord._subscriptions
+
+    # Availability changes notify everyone
+    calls.clear()
+    coord.last_update_success = False
+    coord._unnotified_changes = []
+    coord.async_update_listeners()
+    assert sorted(calls) == ["node", "other", "p1"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_restore_and_save(DummyAPI):
+    snapshot = {"nodes": {"n1": {"p1": {"name": "p1", "value": 1}}}}
+    saved = []
+
+    class FakeStore:
+        async def async_load(self):
+            return snapshot
+
+        def async_delay_save(self, data_func, delay):
+            saved.append(data_func())
+
+    nodes = {
+        "node_details": [
+            {
+                "id": "n1",
+                "params": {"multicontrol": {"p1": 2}},
+                "config": {"devices": [{"params": [{"name": "p1"}]}]},
+            }
+        ]
+    }
+    coord = RainmakerCoordinator(SimpleNamespace(), DummyAPI(nodes=nodes))
+    coord._store = FakeStore()
+
+    assert await coord.async_restore_snapshot()
+    assert coord.is_stale
+    assert coord.data["n1"]["p1"].value == 1
+
+    coord.data = await coord._async_update_data()
+    assert not coord.is_stale
+    # Snapshots are stored in the plain dict form
+    assert saved[0] == {"nodes": {"n1": {"p1": {"name": "p1", "value": 2}}}}
+
+    # Values shown optimistically are stored as the value the cloud reported
+    coord._async_apply_optimistic("n1", {"p1": 5})
+    assert coord.data["n1"]["p1"].value == 5
+    coord._schedule_snapshot_save(coord.data)
+    assert saved[-1] == {"nodes": {"n1": {"p1": {"name": "p1", "value": 2}}}}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_restore_without_store(DummyAPI):
+    coord = RainmakerCoordinator(SimpleNamespace(), DummyAPI())
+    assert not await coord.async_restore_snapshot()
+
+
+def test_entity_descriptors_are_classified_once_per_schema(DummyAPI):
+    from homeassistant.const import Platform
+
+    coord = RainmakerCoordinator(SimpleNamespace(), DummyAPI())
+    coord.data = snapshot_from_dict(
+        {
+            "n1": {
+                "Name": {"data_type": "string", "value": "Node"},
+                "schedule_1": {"data_type": "string", "properties": ["read"]},
+                "temp": {"data_type": "float", "properties": ["read"]},
+                "temp_setpoint": {"data_type": "float", "properties": ["write"]},
+                "enabled": {"data_type": "bool", "properties": ["read", "write"]},
+                "alarm": {"data_type": "bool", "properties": ["read"]},
+            }
+        }
+    )
+
+    assert [d.param for d in coord.entity_descriptors(Platform.SENSOR)] == ["temp"]
+    assert [d.param for d in coord.entity_descriptors(Platform.NUMBER)] == [
+        "temp_setpoint"
+    ]
+    assert [d.param for d in coord.entity_descriptors(Platform.SWITCH)] == ["enabled"]
+    assert [d.param for d in coord.entity_descriptors(Platform.BINARY_SENSOR)] == [
+        "alarm"
+    ]
+    climate = coord.entity_descriptors(Platform.CLIMATE)
+    assert [(d.node_id, d.param) for d in climate] == [("n1", None)]
+
+    # Value changes keep the table, a rebuilt node replaces it
+    table = coord._descriptors
+    coord.data["n1"]["temp"].value = 21
+    coord.entity_descriptors(Platform.SENSOR)
+    assert coord._descriptors is table
+    coord.data = {**coord.data, "n2": coord.data["n1"]}
+    assert len(coord.entity_descriptors(Platform.SENSOR)) == 2
+    assert coord._descriptors is not table
+
+
+@pytest.mark.asyncio
+async def test_entities_follow_node_and_param_changes(DummyAPI):
+    from unittest.mock import MagicMock
+
+    from homeassistant.const import Platform
+
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(async_create_task=lambda coro: loop.create_task(coro))
+    coord = RainmakerCoordinator(hass, DummyAPI())
+    sensor = {"data_type": "float", "properties": ["read"]}
+    coord.data = snapshot_from_dict({"n1": {"temp": sensor}})
+
+    def create_entity(desc):
+        entity = MagicMock(key=(desc.node_id, desc.param))
+        entity.async_remove = AsyncMock()
+        return entity
+
+    added = []
+    coord.async_add_entity_platform(
+        Platform.SENSOR,
+        create_entity,
+        lambda entities, update: added.append(([e.key for e in entities], update)),
+    )
+    assert added == [([("n1", "temp")], True)]
+    temp = coord._platform_entities[Platform.SENSOR][("n1", "temp")]
+
+    # Updates without schema changes leave the entities alone
+    coord.async_update_listeners()
+    assert len(added) == 1
+
+    # A new node and a param that vanished from n1
+    coord.data = snapshot_from_dict(
+        {"n1": {"humidity": sensor}, "n2": {"temp": sensor}}
+    )
+    coord.async_update_listeners()
+    assert added[1] == ([("n1", "humidity"), ("n2", "temp")], False)
+    await asyncio.sleep(0)
+    temp.async_remove.assert_awaited_once()
+    assert set(coord._platform_entities[Platform.SENSOR]) == {
+        ("n1", "humidity"),
+        ("n2", "temp"),
+    }
+
+    # Entities of a restored snapshot are added without an update
+    coord.is_stale = True
+    coord.async_add_entity_platform(
+        Platform.SENSOR,
+        create_entity,
+        lambda entities, update: added.append(([e.key for e in entities], update)),
+    )
+    assert added[-1] == ([("n1", "humidity"), ("n2", "temp")], False)
+
+
+@pytest.mark.asyncio
+async def test_nodes_removed_from_the_account_lose_their_entities(DummyAPI):
+    from unittest.mock import MagicMock
+
+    from homeassistant.const import Platform
+
+    config = {"devices": [{"params": [{"name": "temp", "data_type": "float"}]}]}
+    nodes = {
+        "node_details": [
+            {"id": node_id, "params": {"multicontrol": {"temp": 1}}, "config": config}
+            for node_id in ("n1", "n2", "n3")
+        ]
+    }
+    # n3 does not parse but is still listed
+    del nodes["node_details"][2]["config"]
+    api = DummyAPI(nodes=nodes)
+    api.async_get_nodes = AsyncMock(return_value=nodes)
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(async_create_task=lambda coro: loop.create_task(coro))
+    coord = RainmakerCoordinator(hass, api)
+    coord.data = snapshot_from_dict(
+        {
+            node_id: {"temp": {"name": "temp", "data_type": "float", "value": 0}}
+            for node_id in ("n1", "n2", "n3")
+        }
+    )
+
+    def create_entity(desc):
+        entity = MagicMock(registry_entry=None)
+        entity.async_remove = AsyncMock()
+        return entity
+
+    coord.async_add_entity_platform(Platform.SENSOR, create_entity, MagicMock())
+    entities = coord._platform_entities[Platform.SENSOR]
+    n2 = entities[("n2", "temp")]
+    n3 = entities[("n3", "temp")]
+
+    coord.data = await coord._async_update_data()
+    coord.async_update_listeners()
+    assert set(coord.data) == {"n1", "n2", "n3"}
+
+    # A node that is no longer listed is dropped with its entities
+    del nodes["node_details"][1]
+    coord.schema_refresh_interval = 0
+    coord.data = await coord._async_update_data()
+    coord.async_update_listeners()
+    await asyncio.sleep(0)
+    assert set(coord.data) == {"n1", "n3"}
+    assert "n2" not in coord.node_health
+    n2.async_remove.assert_awaited_once_with(force_remove=True)
+    n3.async_remove.assert_not_awaited()
+    assert set(entities) == {("n1", "temp"), ("n3", "temp")}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_node_payloads_are_skipped(DummyAPI):
+    from custom_components.zehnder_multicontroller.coordinator import ParamChange
+
+    nodes = {
+        "node_details": [
+            {
+                "id": "n1",
+                "params": {"multicontrol": {"p1": 1}},
+                "config": {"devices": [{"params": [{"name": "p1"}]}]},
+            }
+        ]
+    }
+    api = DummyAPI(nodes=nodes)
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+    coord.data = await coord._async_update_data()
+    node = coord.data["n1"]
+    assert (coord.skipped_node_updates, coord.applied_node_updates) == (0, 1)
+
+    data = await coord._async_update_data()
+    assert data["n1"] is node
+    assert coord.last_changes == []
+    assert (coord.skipped_node_updates, coord.applied_node_updates) == (1, 1)
+
+    nodes["node_details"][0]["params"]["multicontrol"]["p1"] = 2
+    data = await coord._async_update_data()
+    assert coord.last_changes == [ParamChange("n1", "p1", 1, 2)]
+    assert (coord.skipped_node_updates, coord.applied_node_updates) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_are_parsed_in_executor(DummyAPI):
+    import threading
+
+    nodes = {
+        "node_details": [
+            {
+                "id": "n1",
+                "params": {"multicontrol": {"p1": 1, "p2": 2}},
+                "config": {"devices": [{"params": [{"name": "p1"}, {"name": "p2"}]}]},
+            }
+        ]
+    }
+    loop = asyncio.get_running_loop()
+    threads = []
+
+    def add_executor_job(func, *args):
+        def run():
+            threads.append(threading.current_thread())
+            return func(*args)
+
+        return loop.run_in_executor(None, run)
+
+    hass = SimpleNamespace(async_add_executor_job=add_executor_job)
+    coord = RainmakerCoordinator(hass, DummyAPI(nodes=nodes))
+
+    size = len(await coord.api.async_get_nodes_payload())
+    coord.executor_parse_threshold = size
+    coord.data = await coord._async_update_data()
+    assert coord.executor_parses == 0
+    assert coord.last_poll_loop_time > 0
+
+    # Above the threshold decoding and parsing leave the loop
+    coord.executor_parse_threshold = size - 1
+    coord._schema_fetched_at = None
+    coord.data = await coord._async_update_data()
+    assert coord.executor_parses == 1
+    assert threading.main_thread() not in threads
+    assert coord.data["n1"].value("p2") == 2
+
+
+@pytest.mark.asyncio
+async def test_undecodable_payload_fails_the_poll(DummyAPI):
+    api = DummyAPI()
+    api.async_get_nodes_payload = AsyncMock(return_value=b"<html>busy</html>")
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+
+    with pytest.raises(UpdateFailed, match="decode"):
+        await coord._async_update_data()
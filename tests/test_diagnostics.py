@@ -0,0 +1,82 @@
+"""Tests for diagnostics."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from custom_components.zehnder_multicontroller.const import DOMAIN
+from custom_components.zehnder_multicontroller.coordinator import RainmakerCoordinator
+from custom_components.zehnder_multicontroller.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.zehnder_multicontroller.model import snapshot_as_dict
+from custom_components.zehnder_multicontroller.model import snapshot_from_dict
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+CONFIG = {
+    "devices": [
+        {
+            "params": [
+                {"name": "Name", "data_type": "string"},
+                {
+                    "name": "temp_setpoint",
+                    "data_type": "float",
+                    "properties": ["read", "write"],
+                    "bounds": {"min": 18, "max": 28, "step": 0.5},
+                },
+            ]
+        }
+    ]
+}
+
+
+def _node(node_id, name):
+    return {
+        "id": node_id,
+        "params": {"multicontrol": {"Name": name, "temp_setpoint": 21}},
+        "config": {"node_id": node_id, **CONFIG},
+    }
+
+
+@pytest.mark.asyncio
+async def test_identical_schemas_are_shared(DummyAPI):
+    api = DummyAPI(nodes={"node_details": [_node("n1", "A"), _node("n2", "B")]})
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+
+    coord.data = await coord._async_update_data()
+    n1, n2 = coord.data["n1"], coord.data["n2"]
+    # Node configs differ but their params are identical
+    assert coord._schemas["n1"].key != coord._schemas["n2"].key
+    assert n1["temp_setpoint"].meta is n2["temp_setpoint"].meta
+    assert n1.value("Name") == "A" and n2.value("Name") == "B"
+
+    # Restored snapshots share metadata the same way
+    restored = snapshot_from_dict(snapshot_as_dict(coord.data))
+    assert restored["n1"]["temp_setpoint"].meta is restored["n2"]["temp_setpoint"].meta
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_redacts_credentials_and_reports_memory(DummyAPI):
+    api = DummyAPI(nodes={"node_details": [_node("n1", "A"), _node("n2", "B")]})
+    api.stats = {"circuit_state": "closed"}
+    coord = RainmakerCoordinator(SimpleNamespace(), api)
+    coord.data = await coord._async_update_data()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": "h", "username": "user", "password": "secret"},
+        entry_id="e1",
+    )
+    hass = SimpleNamespace(data={DOMAIN: {"e1": {"api": api, "coordinator": coord}}})
+
+    diag = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diag["entry"]["data"]["username"] == "**REDACTED**"
+    assert diag["entry"]["data"]["password"] == "**REDACTED**"
+    assert diag["api"] == {"circuit_state": "closed"}
+    assert diag["nodes"]["n1"]["params"] == 2
+    assert diag["nodes"]["n1"]["available"]
+    memory = diag["memory"]
+    assert memory["params"] == 4
+    assert memory["unique_param_metas"] == 2
+    assert memory["saved_bytes"] > 0
+    assert memory["unshared_meta_bytes"] == memory["meta_bytes"] + memory["saved_bytes"]
@@ -24,3 +24,28 @@ def test_entity_properties(DummyCoordinator):
     attrs = ent.device_state_attributes
     assert attrs["integration"] == "zehnder_multicontroller"
     assert "attribution" in attrs
+
+
+def test_node_entity_assumed_state_while_stale(DummyCoordinator):
+    from custom_components.zehnder_multicontroller.entity import RainmakerNodeEntity
+
+    coord = DummyCoordinator({})
+    ent = RainmakerNodeEntity(coord)
+    assert ent.assumed_state is False
+
+    coord.is_stale = True
+    assert ent.assumed_state is True
+
+
+def test_node_entity_unavailable_with_its_node(DummyCoordinator):
+    from custom_components.zehnder_multicontroller.entity import RainmakerNodeEntity
+
+    coord = DummyCoordinator({})
+    coord.last_update_success = True
+    coord.is_node_available = lambda node_id: node_id != "down"
+    ent = RainmakerNodeEntity(coord)
+    ent._node_id = "up"
+    assert ent.available is True
+
+    ent._node_id = "down"
+    assert ent.available is False
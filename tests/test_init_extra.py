@@ -85,13 +85,25 @@ async def test_async_setup_and_unload(monkeypatch):
         async def async_connect(self):
             return None
 
+        async def async_shutdown(self):
+            return None
+
+        def async_add_write_listener(self, listener):
+            return lambda: None
+
     class FakeCoordinator:
         def __init__(self, hass, api, entry):
             self.data = {}
 
+        def async_note_write(self, node_id, params):
+            return None
+
         async def async_config_entry_first_refresh(self):
             return None
 
+        async def async_shutdown(self):
+            return None
+
     # Prevent migration from touching the real entity registry
     async def _noop_migrate(hass, entry):
         return None
@@ -143,3 +155,54 @@ async def test_async_setup_and_unload(monkeypatch):
     unloaded = await integ.async_unload_entry(hass, entry)
     assert unloaded is True
     assert entry.entry_id not in hass.data.get(DOMAIN, {})
+
+
+@pytest.mark.asyncio
+async def test_failed_setup_releases_the_api(monkeypatch):
+    import sys
+    import types
+
+    from homeassistant.exceptions import ConfigEntryNotReady
+
+    shutdowns = []
+
+    class FakeAPI:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def async_connect(self):
+            raise RuntimeError("cloud down")
+
+        async def async_shutdown(self):
+            shutdowns.append(True)
+
+        def async_add_write_listener(self, listener):
+            return lambda: None
+
+    class FakeCoordinator:
+        def __init__(self, hass, api, entry):
+            self.data = {}
+
+        def async_note_write(self, node_id, params):
+            return None
+
+        async def async_restore_snapshot(self):
+            return False
+
+    api_mod = types.ModuleType("custom_components.zehnder_multicontroller.api")
+    api_mod.RainmakerAPI = FakeAPI
+    coord_mod = types.ModuleType(
+        "custom_components.zehnder_multicontroller.coordinator"
+    )
+    coord_mod.RainmakerCoordinator = FakeCoordinator
+    monkeypatch.setitem(
+        sys.modules, "custom_components.zehnder_multicontroller.api", api_mod
+    )
+    monkeypatch.setitem(
+        sys.modules, "custom_components.zehnder_multicontroller.coordinator", coord_mod
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "h"}, entry_id="e1")
+
+    with pytest.raises(ConfigEntryNotReady):
+        await integ.async_setup_entry(type("H", (), {"data": {}})(), entry)
+    assert shutdowns == [True]
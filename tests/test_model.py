@@ -0,0 +1,58 @@
+"""Tests for the snapshot model."""
+from __future__ import annotations
+
+import pytest
+from custom_components.zehnder_multicontroller.model import NodeState
+from custom_components.zehnder_multicontroller.model import ParamMeta
+from custom_components.zehnder_multicontroller.model import ParamState
+from custom_components.zehnder_multicontroller.model import snapshot_as_dict
+from custom_components.zehnder_multicontroller.model import snapshot_from_dict
+
+
+def test_param_meta_from_config():
+    raw = {
+        "name": "temp_setpoint",
+        "data_type": "float",
+        "properties": ["read", "write"],
+        "bounds": {"min": 18, "max": 28},
+        "value": 21,
+    }
+    meta = ParamMeta.from_config("temp_setpoint", raw)
+
+    assert meta.data_type == "float"
+    assert meta.properties == frozenset({"read", "write"})
+    assert meta.bounds == {"min": 18, "max": 28}
+    # Values never end up in the shared metadata, which is read-only
+    assert "value" not in meta.raw
+    with pytest.raises(TypeError):
+        meta.bounds["min"] = 0
+
+    missing = ParamMeta.from_config("p", {"name": "p"})
+    assert missing.properties == frozenset()
+    assert missing.bounds is None
+
+
+def test_node_state_access():
+    meta = ParamMeta.from_config("p1", {"name": "p1", "data_type": "int"})
+    node = NodeState("n1", {"p1": ParamState(meta, 3)})
+
+    assert node.value("p1") == 3
+    assert node.value("missing", "x") == "x"
+    assert node["p1"].value == 3
+    assert node["p1"].meta.data_type == "int"
+    assert node["p1"].meta.raw["data_type"] == "int"
+    assert list(node) == ["p1"]
+
+
+def test_snapshot_dict_round_trip():
+    stored = {
+        "n1": {
+            "Name": {"name": "Name", "value": "Living"},
+            "p1": {"name": "p1", "bounds": {"min": 0}, "value": 1},
+        }
+    }
+    nodes = snapshot_from_dict(stored)
+
+    assert nodes["n1"].node_id == "n1"
+    assert nodes["n1"].value("Name") == "Living"
+    assert snapshot_as_dict(nodes) == stored
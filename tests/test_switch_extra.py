@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import pytest
+from custom_components.zehnder_multicontroller.api import RainmakerNodeOfflineError
 from custom_components.zehnder_multicontroller.const import DOMAIN
 from custom_components.zehnder_multicontroller.switch import async_setup_entry
 from custom_components.zehnder_multicontroller.switch import RainmakerParamSwitch
@@ -31,3 +32,24 @@ def test_switch_is_on_none(DummyCoordinator):
     ent = RainmakerParamSwitch(coord, "entry1", "n1", "Node One", "param")
     # coordinator has param but no value -> is_on is None
     assert ent.is_on is None
+
+
+@pytest.mark.asyncio
+async def test_switch_write_errors_are_raised(DummyCoordinator):
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+
+    from homeassistant.exceptions import HomeAssistantError
+
+    data = {"n1": {"param": {"value": True, "data_type": "bool"}}}
+    coord = DummyCoordinator(data)
+    coord.async_set_param = AsyncMock(
+        side_effect=RainmakerNodeOfflineError("Node n1 is offline")
+    )
+    ent = RainmakerParamSwitch(coord, "entry1", "n1", "Node One", "param")
+    ent.hass = SimpleNamespace(data={DOMAIN: {"entry1": {"coordinator": coord}}})
+
+    with pytest.raises(HomeAssistantError, match="offline"):
+        await ent.async_turn_off()
+    with pytest.raises(HomeAssistantError):
+        await ent.async_turn_on()
@@ -40,7 +40,7 @@ async def test_switch_setup_and_operations(DummyCoordinator, DummyAPI):
     # Turn on -> should call api and request refresh
     await sw.async_turn_on()
     api.async_set_param.assert_called_with("node", "power", True)
-    coord.async_request_refresh.assert_awaited()
+    coord.async_request_refresh.assert_not_awaited()
 
     # Turn off -> should call api and request refresh
     api.async_set_param.reset_mock()